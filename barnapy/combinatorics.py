@@ -34,13 +34,27 @@ def _score_ksubset_by_sum_counts_subsets(
         counts: dict[tuple, int], subsets: list[tuple]) -> int:
     return sum(counts.get(s, 0) for s in subsets)
 
+def _subset_masks_by_size(
+        set: tuple, max_size: int) -> tuple[tuple[int, ...], ...]:
+    """
+    Return the subsets (of sizes `1:max_size`) of the given set of
+    integers as bitmasks grouped by size, largest size first.
+
+    Bitmasks are cheaper to hash and count than tuples, and grouping
+    them by size avoids recomputing sizes when scoring.
+    """
+    bits = [1 << element for element in set]
+    return tuple(tuple(sum(combo) for combo in itools.combinations(bits, size))
+                 for size in range(max_size, 0, -1))
+
 def _score_ksubset_by_size2count_desc(
-        counts: dict[tuple, int], subsets: list[tuple]) -> tuple:
-    size2count = {}
-    for subset in subsets:
-        size = len(subset)
-        size2count[size] = size2count.get(size, 0) + counts.get(subset, 0)
-    return tuple(c for (s, c) in sorted(size2count.items(), reverse=True))
+        counts: dict[int, int],
+        subset_masks_by_size: tuple[tuple[int, ...], ...],
+) -> tuple:
+    # Sum the counts of each size of subset, largest size first
+    get = counts.get
+    return tuple(sum(map(get, masks, itools.repeat(0)))
+                 for masks in subset_masks_by_size)
 
 def _ksubset_min_score(
         ksubsets: list[tuple],
@@ -63,6 +77,13 @@ def _count_subsets(counts: dict[tuple, int], subsets: list[tuple]) -> None:
     for subset in subsets:
         counts[subset] = counts.get(subset, 0) + 1
 
+def _count_subset_masks(
+        counts: dict[int, int],
+        subset_masks_by_size: tuple[tuple[int, ...], ...],
+) -> None:
+    for masks in subset_masks_by_size:
+        _count_subsets(counts, masks)
+
 def balanced_subsets__repeated_min_score(
         n_elements: int,
         subset_size: int,
@@ -75,7 +96,7 @@ def balanced_subsets__repeated_min_score(
         balance_level = subset_size
     counts = {}
     ksubsets = list(itools.combinations(range(n_elements), subset_size))
-    subsets = [list(_subsets(s, 1, balance_level)) for s in ksubsets]
+    subsets = [_subset_masks_by_size(s, balance_level) for s in ksubsets]
     # Repeatedly generate the ksubset with the minimum score until all
     # ksubsets have been generated
     n_ksubsets = len(ksubsets)
@@ -86,7 +107,7 @@ def balanced_subsets__repeated_min_score(
         (score, ksubset) = min(scores_ksubsets)
         yield ksubset
         idx_min = scores_ksubsets.index((score, ksubset))
-        _count_subsets(counts, subsets[idx_min])
+        _count_subset_masks(counts, subsets[idx_min])
         if delete_after_yield:
             del ksubsets[idx_min]
             del subsets[idx_min]
@@ -103,14 +124,14 @@ def balanced_subsets__heapq(
         balance_level = subset_size - 1
     counts = {}
     score = (0,) * balance_level
-    ksubsets_q = list((score, ksubset, list(_subsets(ksubset, 1, balance_level)))
+    ksubsets_q = list((score, ksubset, _subset_masks_by_size(ksubset, balance_level))
                       for ksubset in itools.combinations(range(n_elements), subset_size))
     while len(ksubsets_q) > 0:
         (old_score, ksubset, its_subsets) = heapq.heappop(ksubsets_q)
         new_score = _score_ksubset_by_size2count_desc(counts, its_subsets)
         if old_score == new_score:
             yield ksubset
-            _count_subsets(counts, its_subsets)
+            _count_subset_masks(counts, its_subsets)
         else:
             heapq.heappush(ksubsets_q, (new_score, ksubset, its_subsets))
 
@@ -13,6 +13,13 @@ class TwoByTwoTable(object):
 
     """
 
+    # All the cells and marginals are computed once at construction so
+    # that reading them is just reading an attribute
+    __slots__ = (
+        '_exp_out', '_exp_no_out', '_out_no_exp', '_no_exp_out',
+        '_exp_tot', '_no_exp_tot', '_out_tot', '_no_out_tot', '_total',
+    )
+
     _num_arg_types = (int, float)
 
     def __init__(
@@ -28,8 +35,13 @@ class TwoByTwoTable(object):
             and isinstance(total, self._num_arg_types)
             ):
             self._exp_out = exp_out
+            self._exp_no_out = exp_tot - exp_out
+            self._out_no_exp = out_tot - exp_out
+            self._no_exp_out = total - exp_tot - out_tot + exp_out
             self._exp_tot = exp_tot
+            self._no_exp_tot = total - exp_tot
             self._out_tot = out_tot
+            self._no_out_tot = total - out_tot
             self._total = total
         # Handle construction from 2-by-2 table
         elif (isinstance(exp_out, self._num_arg_types)
@@ -38,8 +50,13 @@ class TwoByTwoTable(object):
               and isinstance(no_exp_out, self._num_arg_types)
               ):
             self._exp_out = exp_out
+            self._exp_no_out = exp_no_out
+            self._out_no_exp = out_no_exp
+            self._no_exp_out = no_exp_out
             self._exp_tot = exp_out + exp_no_out
+            self._no_exp_tot = out_no_exp + no_exp_out
             self._out_tot = exp_out + out_no_exp
+            self._no_out_tot = exp_no_out + no_exp_out
             self._total = (
                 exp_out + exp_no_out + out_no_exp + no_exp_out)
         # Construction modes are only the above, bad arguments otherwise
@@ -54,15 +71,15 @@ class TwoByTwoTable(object):
 
     @property
     def exp_no_out(self):
-        return self._exp_tot - self._exp_out
+        return self._exp_no_out
 
     @property
     def out_no_exp(self):
-        return self._out_tot - self._exp_out
+        return self._out_no_exp
 
     @property
     def no_exp_out(self):
-        return self._total - self._exp_tot - self._out_tot + self._exp_out
+        return self._no_exp_out
 
     @property
     def exp_tot(self):
@@ -70,7 +87,7 @@ class TwoByTwoTable(object):
 
     @property
     def no_exp_tot(self):
-        return self._total - self._exp_tot
+        return self._no_exp_tot
 
     @property
     def out_tot(self):
@@ -78,7 +95,7 @@ class TwoByTwoTable(object):
 
     @property
     def no_out_tot(self):
-        return self._total - self._out_tot
+        return self._no_out_tot
 
     @property
     def total(self):
@@ -90,37 +107,37 @@ class TwoByTwoTable(object):
 
         """
         return TwoByTwoTable(
-            exp_out=self.exp_out + pseudocount,
-            exp_no_out=self.exp_no_out + pseudocount,
-            out_no_exp=self.out_no_exp + pseudocount,
-            no_exp_out=self.no_exp_out + pseudocount,
+            exp_out=self._exp_out + pseudocount,
+            exp_no_out=self._exp_no_out + pseudocount,
+            out_no_exp=self._out_no_exp + pseudocount,
+            no_exp_out=self._no_exp_out + pseudocount,
             )
 
     def table_2x2(self, pseudocount=None):
         if isinstance(pseudocount, self._num_arg_types):
-            return ((self.exp_out + pseudocount,
-                     self.exp_no_out + pseudocount),
-                    (self.out_no_exp + pseudocount,
-                     self.no_exp_out + pseudocount))
+            return ((self._exp_out + pseudocount,
+                     self._exp_no_out + pseudocount),
+                    (self._out_no_exp + pseudocount,
+                     self._no_exp_out + pseudocount))
         else:
-            return ((self.exp_out, self.exp_no_out),
-                    (self.out_no_exp, self.no_exp_out))
+            return ((self._exp_out, self._exp_no_out),
+                    (self._out_no_exp, self._no_exp_out))
 
     def table_3x3(self, pseudocount=None):
         if isinstance(pseudocount, self._num_arg_types):
-            return ((self.exp_out + pseudocount,
-                     self.exp_no_out + pseudocount,
-                     self.exp_tot + 2 * pseudocount),
-                    (self.out_no_exp + pseudocount,
-                     self.no_exp_out + pseudocount,
-                     self.no_exp_tot + 2 * pseudocount),
-                    (self.out_tot + 2 * pseudocount,
-                     self.no_out_tot + 2 * pseudocount,
-                     self.total + 4 * pseudocount))
+            return ((self._exp_out + pseudocount,
+                     self._exp_no_out + pseudocount,
+                     self._exp_tot + 2 * pseudocount),
+                    (self._out_no_exp + pseudocount,
+                     self._no_exp_out + pseudocount,
+                     self._no_exp_tot + 2 * pseudocount),
+                    (self._out_tot + 2 * pseudocount,
+                     self._no_out_tot + 2 * pseudocount,
+                     self._total + 4 * pseudocount))
         else:
-            return ((self.exp_out, self.exp_no_out, self.exp_tot),
-                    (self.out_no_exp, self.no_exp_out, self.no_exp_tot),
-                    (self.out_tot, self.no_out_tot, self.total))
+            return ((self._exp_out, self._exp_no_out, self._exp_tot),
+                    (self._out_no_exp, self._no_exp_out, self._no_exp_tot),
+                    (self._out_tot, self._no_out_tot, self._total))
 
 
 class TemporalTwoByTwoTable(TwoByTwoTable):
@@ -129,6 +146,8 @@ class TemporalTwoByTwoTable(TwoByTwoTable):
 
     """
 
+    __slots__ = ('_exp_bef_out', '_exp_aft_out')
+
     def __init__(
             self,
             exp_bef_out=None, exp_aft_out=None, exp_out=None,
@@ -178,12 +197,12 @@ class TemporalTwoByTwoTable(TwoByTwoTable):
         """
         half_count = pseudocount / 2
         return TemporalTwoByTwoTable(
-            exp_bef_out=self.exp_bef_out + half_count,
-            exp_aft_out=self.exp_aft_out + half_count,
-            exp_out=self.exp_out + pseudocount,
-            exp_no_out=self.exp_no_out + pseudocount,
-            out_no_exp=self.out_no_exp + pseudocount,
-            no_exp_out=self.no_exp_out + pseudocount,
+            exp_bef_out=self._exp_bef_out + half_count,
+            exp_aft_out=self._exp_aft_out + half_count,
+            exp_out=self._exp_out + pseudocount,
+            exp_no_out=self._exp_no_out + pseudocount,
+            out_no_exp=self._out_no_exp + pseudocount,
+            no_exp_out=self._no_exp_out + pseudocount,
             )
 
     def cohort_table(self):
@@ -203,88 +222,119 @@ class TemporalTwoByTwoTable(TwoByTwoTable):
             )
 
 
+def _mi_term(joint, total, expected):
+    """Return `joint * log(joint * total / expected)`
+
+    When the ratio is near 1 (nearly independent variables), the log is
+    computed as `log1p((joint * total - expected) / expected)` to keep it
+    accurate.  (For counts, the difference is exact.)  Elsewhere the
+    ratio is used directly since the difference can lose precision or
+    round to less than -1.
+
+    """
+    ratio = joint * total / expected
+    if 0.5 <= ratio <= 2:
+        return joint * math.log1p((joint * total - expected) / expected)
+    return joint * math.log(ratio)
+
+
 def binary_mutual_information(table):
     """Return the mutual information between the two binary variables in the
     given 2-by-2 table
 
     """
+    # Read each cell and marginal once since they are properties
+    total = table.total
     # Shortcut / Special-Case the zero distribution
-    if table.total == 0:
+    if total == 0:
         return 0.0
+    exp_out = table.exp_out
+    exp_no_out = table.exp_no_out
+    out_no_exp = table.out_no_exp
+    no_exp_out = table.no_exp_out
+    exp_tot = table.exp_tot
+    no_exp_tot = table.no_exp_tot
+    out_tot = table.out_tot
+    no_out_tot = table.no_out_tot
     # Do the calculation in a way that handles zeros.  (If the numerator
     # in the log is greater than zero, the denominator cannot be zero.)
     mi_sum = 0.0
-    if table.exp_out > 0:
-        mi_sum += (table.exp_out
-                   * math.log((table.exp_out * table.total)
-                              / (table.exp_tot * table.out_tot)))
-    if table.exp_no_out > 0:
-        mi_sum += (table.exp_no_out
-                   * math.log((table.exp_no_out * table.total)
-                              / (table.exp_tot * table.no_out_tot)))
-    if table.out_no_exp > 0:
-        mi_sum += (table.out_no_exp
-                   * math.log((table.out_no_exp * table.total)
-                              / (table.out_tot * table.no_exp_tot)))
-    if table.no_exp_out > 0:
-        mi_sum += (table.no_exp_out
-                   * math.log((table.no_exp_out * table.total)
-                              / (table.no_out_tot * table.no_exp_tot)))
-    return mi_sum / table.total
+    if exp_out > 0:
+        mi_sum += _mi_term(exp_out, total, exp_tot * out_tot)
+    if exp_no_out > 0:
+        mi_sum += _mi_term(exp_no_out, total, exp_tot * no_out_tot)
+    if out_no_exp > 0:
+        mi_sum += _mi_term(out_no_exp, total, out_tot * no_exp_tot)
+    if no_exp_out > 0:
+        mi_sum += _mi_term(no_exp_out, total, no_out_tot * no_exp_tot)
+    return mi_sum / total
 
 
 def relative_risk(table):
     """Return the relative risk for the given 2-by-2 table"""
+    # Read each cell and marginal once since they are properties
+    exp_out = table.exp_out
+    out_no_exp = table.out_no_exp
+    exp_tot = table.exp_tot
+    no_exp_tot = table.no_exp_tot
     # When all the cells are zero or both numerators are zero the rates
     # are "equal" so the relative risk is one
-    if ((table.exp_tot == 0 and table.no_exp_tot == 0)
-        or (table.exp_out == 0 and table.out_no_exp == 0)
+    if ((exp_tot == 0 and no_exp_tot == 0)
+        or (exp_out == 0 and out_no_exp == 0)
         ):
         return 1.0
     # If the numerator rate is zero, then the relative risk cannot get
     # any less, so it is also zero
-    elif table.exp_tot == 0:
+    elif exp_tot == 0:
         return 0.0
     # If the denominator rate is zero, then the relative risk cannot get
     # any larger, so it is infinity
-    elif table.no_exp_tot == 0:
+    elif no_exp_tot == 0:
         return float('inf')
     # (eo/et)/(one/net) -> (eo*net)/(one*et)
-    return ((table.exp_out * table.no_exp_tot)
-            / (table.out_no_exp * table.exp_tot))
+    return (exp_out * no_exp_tot) / (out_no_exp * exp_tot)
 
 
 def odds_ratio(table):
     """Return the odds ratio for the given 2-by-2 table"""
+    # Read each cell and marginal once since they are properties
+    exp_out = table.exp_out
+    exp_no_out = table.exp_no_out
+    out_no_exp = table.out_no_exp
+    no_exp_out = table.no_exp_out
+    exp_tot = table.exp_tot
+    no_exp_tot = table.no_exp_tot
     # When all the cells are zero or both numerators are zero the odds
     # are "equal" so the ratio is one
-    if ((table.exp_tot == 0 and table.no_exp_tot == 0)
-        or (table.exp_out == 0 and table.out_no_exp == 0)
+    if ((exp_tot == 0 and no_exp_tot == 0)
+        or (exp_out == 0 and out_no_exp == 0)
         ):
         return 1.0
     # If the numerator odds are zero, then the ratio cannot get any
     # less, so it is zero
-    elif table.exp_tot == 0:
+    elif exp_tot == 0:
         return 0.0
     # If the denominator odds are zero, then the ratio cannot get any
     # larger, so it is infinity
-    elif table.no_exp_tot == 0:
+    elif no_exp_tot == 0:
         return float('inf')
     # (eo/eno)/(one/neo) -> (eo*neo)/(eno*one)
-    return ((table.exp_out * table.no_exp_out)
-            / (table.exp_no_out * table.out_no_exp))
+    return (exp_out * no_exp_out) / (exp_no_out * out_no_exp)
 
 
 def absolute_risk_difference(table):
     """Return the absolute risk difference for the given 2-by-2 table"""
+    # Read each marginal once since they are properties
+    exp_tot = table.exp_tot
+    no_exp_tot = table.no_exp_tot
     # Absolute risk difference: (eo/et)-(one/net)
     # Define the risk as zero if the row totals are zero to avoid
     # division by zero
-    risk_exp = ((table.exp_out / table.exp_tot)
-                if table.exp_tot > 0
+    risk_exp = ((table.exp_out / exp_tot)
+                if exp_tot > 0
                 else 0.0)
-    risk_no_exp = ((table.out_no_exp / table.no_exp_tot)
-                   if table.no_exp_tot > 0
+    risk_no_exp = ((table.out_no_exp / no_exp_tot)
+                   if no_exp_tot > 0
                    else 0.0)
     # Return the difference of the risks of outcome in the exposed and
     # unexposed
@@ -12,6 +12,18 @@ formats.
 import csv
 
 
+# Codes for the dialect parameters that are given by letter
+_doublequote_codes = {'d': True, 'D': True, 'e': False, 'E': False}
+_quoting_codes = {
+    'm': csv.QUOTE_MINIMAL, 'M': csv.QUOTE_MINIMAL,
+    'a': csv.QUOTE_ALL, 'A': csv.QUOTE_ALL,
+    'n': csv.QUOTE_NONE, 'N': csv.QUOTE_NONE,
+    'o': csv.QUOTE_NONNUMERIC, 'O': csv.QUOTE_NONNUMERIC,
+}
+_skipinitialspace_codes = {'k': False, 'K': False, 't': True, 'T': True}
+_strict_codes = {'l': False, 'L': False, 's': True, 'S': True}
+
+
 def parse_csv_dialect(chars):
     """
     Interpret the given string as a dialect for the Python CSV
@@ -63,55 +75,44 @@ def parse_csv_dialect(chars):
         character (which seems extremely reasonable).
     """
     dialect = {}
-    if len(chars) >= 1:
+    n_chars = len(chars)
+    if n_chars >= 1:
         dialect['delimiter'] = chars[0]
-    if len(chars) >= 2:
+    if n_chars >= 2:
         dialect['quotechar'] = chars[1]
-    if len(chars) >= 3:
-        if chars[2] in ('d', 'D'):
-            dialect['doublequote'] = True
-        elif chars[2] in ('e', 'E'):
-            dialect['doublequote'] = False
-        else:
+    if n_chars >= 3:
+        doublequote = _doublequote_codes.get(chars[2])
+        if doublequote is None:
             raise ValueError(
                 "Unrecognized CSV dialect parameter: doubling or escaping: "
                 f"'{chars[2]}' (not 'd' or 'e')")
-    if len(chars) >= 4:
+        dialect['doublequote'] = doublequote
+    if n_chars >= 4:
         if chars[3] == ' ':
             dialect['escapechar'] = None
         else:
             dialect['escapechar'] = chars[3]
-    if len(chars) >= 5:
-        if chars[4] in ('m', 'M'):
-            dialect['quoting'] = csv.QUOTE_MINIMAL
-        elif chars[4] in ('a', 'A'):
-            dialect['quoting'] = csv.QUOTE_ALL
-        elif chars[4] in ('n', 'N'):
-            dialect['quoting'] = csv.QUOTE_NONE
-        elif chars[4] in ('o', 'O'):
-            dialect['quoting'] = csv.QUOTE_NONNUMERIC
-        else:
+    if n_chars >= 5:
+        quoting = _quoting_codes.get(chars[4])
+        if quoting is None:
             raise ValueError(
                 "Unrecognized CSV dialect parameter: quoting mode: "
                 f"'{chars[4]}' (not 'm', 'a', 'n', or 'o')")
-    if len(chars) >= 6:
-        if chars[5] in ('k', 'K'):
-            dialect['skipinitialspace'] = False
-        elif chars[5] in ('t', 'T'):
-            dialect['skipinitialspace'] = True
-        else:
+        dialect['quoting'] = quoting
+    if n_chars >= 6:
+        skipinitialspace = _skipinitialspace_codes.get(chars[5])
+        if skipinitialspace is None:
             raise ValueError(
                 "Unrecognized CSV dialect parameter: trim space: "
                 f"'{chars[5]}' (not 'k' or 't')")
-    if len(chars) >= 7:
-        if chars[6] in ('l', 'L'):
-            dialect['strict'] = False
-        elif chars[6] in ('s', 'S'):
-            dialect['strict'] = True
-        else:
+        dialect['skipinitialspace'] = skipinitialspace
+    if n_chars >= 7:
+        strict = _strict_codes.get(chars[6])
+        if strict is None:
             raise ValueError(
                 "Unrecognized CSV dialect parameter: strict length: "
                 f"'{chars[6]}' (not 'l' or 's')")
-    if len(chars) >= 8:
+        dialect['strict'] = strict
+    if n_chars >= 8:
         dialect['lineterminator'] = chars[7:]
     return dialect
@@ -80,3 +80,30 @@ def numpy_bit_generator(
         },
     }
     return mt_bit_gen
+
+
+def sample_sequence(
+        items, sample_size: int, prng: numpy.random.Generator=None):
+    """
+    Sample the given sequence without replacement and return the sample
+    as an array (if `items` is an array) or a list.
+
+    Like `sampling.reservoir_sample` but for sequences of known length,
+    such as lists and arrays.  All the random indices are drawn in a
+    single vectorized call rather than item by item.  If the sample size
+    is larger than the number of items, then the sample will just
+    include all the items.
+
+    * items: Sequence or `numpy.ndarray`
+    * sample_size: How many items to sample
+    * prng: `numpy.random.Generator` to use.  If `None`, use
+      `numpy.random.default_rng()`.
+    """
+    if prng is None:
+        prng = numpy.random.default_rng()
+    n_items = len(items)
+    sample_size = max(min(sample_size, n_items), 0)
+    idxs = prng.choice(n_items, size=sample_size, replace=False)
+    if isinstance(items, numpy.ndarray):
+        return items[idxs]
+    return [items[idx] for idx in idxs.tolist()]
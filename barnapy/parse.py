@@ -24,10 +24,12 @@ Requires Python >= 3.4 for `re.fullmatch`.
 
 
 from collections.abc import Callable, Iterable
+import array
 import ast
 import builtins
 import enum
 import datetime as pydt
+import functools
 import re
 import typing
 
@@ -157,6 +159,30 @@ none_pattern = re.compile(r'none', re.IGNORECASE)
 none_word_pattern = re.compile(r'n(?:a|ull|il)', re.IGNORECASE)
 
 
+  ### Padded Atoms ###
+
+
+def _mk_padded_pattern(pattern: re.Pattern) -> re.Pattern:
+    """
+    Return a version of the given pattern that also matches surrounding
+    whitespace.  Full matching against the padded pattern is equivalent
+    to stripping the text and full matching against the original.
+    """
+    return re.compile(rf'\s*(?:{pattern.pattern})\s*', pattern.flags)
+
+# Detectors match these against the given text to avoid stripping it
+_integer_padded_pattern = _mk_padded_pattern(integer_pattern)
+_float_padded_pattern = _mk_padded_pattern(float_pattern)
+_inf_nan_padded_pattern = _mk_padded_pattern(inf_nan_pattern)
+_bool_true_padded_pattern = _mk_padded_pattern(bool_true_pattern)
+_bool_false_padded_pattern = _mk_padded_pattern(bool_false_pattern)
+_bool_word_true_padded_pattern = _mk_padded_pattern(bool_word_true_pattern)
+_bool_word_false_padded_pattern = _mk_padded_pattern(
+    bool_word_false_pattern)
+_none_padded_pattern = _mk_padded_pattern(none_pattern)
+_none_word_padded_pattern = _mk_padded_pattern(none_word_pattern)
+
+
  #### Patterns for Compound Literals ####
 
 
@@ -282,6 +308,60 @@ start with a letter or underscore)
 """
 name_pattern = re.compile(r'[a-zA-Z_]\w*')
 
+_name_padded_pattern = _mk_padded_pattern(name_pattern)
+
+
+  ### Any Atom ###
+
+
+def _mk_atom_alternation_pattern(
+        kind_pattern_pairs: Iterable[tuple[str, re.Pattern]],
+        allow_inf_nan: builtins.bool=True,
+) -> re.Pattern:
+    """
+    Return a pattern that matches any of the given patterns (plus
+    surrounding whitespace) in a single pass, capturing the match in a
+    group named by the kind of atom.  Alternatives are tried in order,
+    so the pattern behaves like trying the given patterns in sequence.
+    """
+    alternatives = []
+    for (kind, pattern) in kind_pattern_pairs:
+        if kind == 'inf_nan' and not allow_inf_nan:
+            continue
+        regex = pattern.pattern
+        if pattern.flags & re.IGNORECASE:
+            regex = f'(?i:{regex})'
+        alternatives.append(f'(?P<{kind}>{regex})')
+    return re.compile(r'\s*(?:' + '|'.join(alternatives) + r')\s*')
+
+# Patterns for the cascades in `atom_err` and `cli_atom_err`, with and
+# without infinities and NaNs
+_cli_atom_kind_pattern_pairs = (
+    ('int', integer_pattern),
+    ('float', float_pattern),
+    ('inf_nan', inf_nan_pattern),
+    ('true', bool_true_pattern),
+    ('false', bool_false_pattern),
+)
+_atom_kind_pattern_pairs = _cli_atom_kind_pattern_pairs + (
+    ('none', none_pattern),
+    ('name', name_pattern),
+)
+_atom_padded_pattern = _mk_atom_alternation_pattern(
+    _atom_kind_pattern_pairs)
+_atom_finite_padded_pattern = _mk_atom_alternation_pattern(
+    _atom_kind_pattern_pairs, allow_inf_nan=False)
+_cli_atom_padded_pattern = _mk_atom_alternation_pattern(
+    _cli_atom_kind_pattern_pairs)
+_cli_atom_finite_padded_pattern = _mk_atom_alternation_pattern(
+    _cli_atom_kind_pattern_pairs, allow_inf_nan=False)
+
+# Characters that can start an atom (besides decimal digits).  Checking
+# the first character rejects most non-atoms without running a regex.
+_cli_atom_first_chars = frozenset('+-.iInNtTfF')
+_atom_first_chars = frozenset(
+    '+-._abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ')
+
 
   ### Punctuation ###
 
@@ -297,11 +377,16 @@ punctuation_word_pattern = re.compile(
 """Template for strings without embedded quotes"""
 string_simple_pattern_template = r'{0}[^{0}]*{0}'
 
+# The following string templates are "unrolled" so that the repeated
+# content cannot be split in more than one way.  (Nesting a repeated
+# character class in another repetition causes exponential backtracking
+# on unterminated strings.)
+
 """Template for strings that embed quotes by escaping"""
-string_escaped_pattern_template = r'{0}(?:[^{0}{1}]+|{1}.)*{0}'
+string_escaped_pattern_template = r'{0}[^{0}{1}]*(?:{1}.[^{0}{1}]*)*{0}'
 
 """Template for strings that embed quotes by doubling"""
-string_doubled_pattern_template = r'{0}(?:[^{0}]+|{0}{0})*{0}'
+string_doubled_pattern_template = r'{0}[^{0}]*(?:{0}{0}[^{0}]*)*{0}'
 
 """Pattern that matches simple strings quoted with `'`"""
 string_simple_single_quoted_pattern = re.compile(
@@ -360,16 +445,32 @@ comment_hash_single_pattern = re.compile(
  #### Detecting & Parsing Atomic Literals (Atoms) ####
 
 
+# Detecting and parsing atoms is typically done many times on only a
+# few distinct texts (e.g. the cells of a CSV column), so memoize the
+# detectors and parsers.  The cache size bounds the memory used.
+_memoize_atom = functools.lru_cache(maxsize=2048)
+
+
   ### Numbers ###
 
 
+@_memoize_atom
 def is_int(text: str) -> builtins.bool:
     """Whether the given text repesents an integer."""
-    return integer_pattern.fullmatch(text.strip()) is not None
+    return _integer_padded_pattern.fullmatch(text) is not None
+
+@_memoize_atom
+def _int_or_none(text: str) -> builtins.int | None:
+    # Detect and convert in one call so that repeated texts are neither
+    # matched nor converted again
+    if _integer_padded_pattern.fullmatch(text) is not None:
+        return builtins.int(text)
+    return None
 
 def int(text: str, default: object=None) -> builtins.int | object:
     """Return an integer parsed from the given text, else `default`."""
-    return builtins.int(text) if is_int(text) else default
+    value = _int_or_none(text)
+    return value if value is not None else default
 
 def int_err(text: str) -> tuple[builtins.int, ParseError]:
     """
@@ -377,27 +478,37 @@ def int_err(text: str) -> tuple[builtins.int, ParseError]:
 
     Return a (value, error) pair per Go style.
     """
-    if is_int(text):
-        return (builtins.int(text), None)
+    value = _int_or_none(text)
+    if value is not None:
+        return (value, None)
     else:
         return (None, ParseError('Cannot parse an integer from', text))
 
 
+@_memoize_atom
 def is_float(text: str, allow_inf_nan: builtins.bool=True) -> builtins.bool:
     """Whether the given text represents a float."""
-    txt = text.strip()
-    return (float_pattern.fullmatch(txt) is not None or
+    return (_float_padded_pattern.fullmatch(text) is not None or
             (allow_inf_nan and
-             inf_nan_pattern.fullmatch(txt) is not None))
+             _inf_nan_padded_pattern.fullmatch(text) is not None))
+
+@_memoize_atom
+def _float_or_none(
+        text: str, allow_inf_nan: builtins.bool=True,
+) -> builtins.float | None:
+    if (_float_padded_pattern.fullmatch(text) is not None
+            or _integer_padded_pattern.fullmatch(text) is not None
+            or (allow_inf_nan and
+                _inf_nan_padded_pattern.fullmatch(text) is not None)):
+        return builtins.float(text.strip())
+    return None
 
 def float(
         text: str, default: object=None, allow_inf_nan: builtins.bool=True,
 ) -> builtins.float | object:
     """Return a float parsed from the given text, else `default`."""
-    txt = text.strip()
-    return (builtins.float(txt)
-            if is_float(txt, allow_inf_nan) or is_int(txt)
-            else default)
+    value = _float_or_none(text, allow_inf_nan)
+    return value if value is not None else default
 
 def float_err(
         text: str, allow_inf_nan: builtins.bool=True,
@@ -407,9 +518,9 @@ def float_err(
 
     Return a (value, error) pair per Go style.
     """
-    txt = text.strip()
-    if is_float(txt, allow_inf_nan) or is_int(txt):
-        return (builtins.float(txt), None)
+    value = _float_or_none(text, allow_inf_nan)
+    if value is not None:
+        return (value, None)
     else:
         return (None, ParseError('Cannot parse a float from', text))
 
@@ -417,21 +528,43 @@ def float_err(
   ### Constants / Nothings ###
 
 
+# The constants are a few words, so look up ASCII texts in tables rather
+# than running the case-insensitive patterns.  Non-ASCII texts use the
+# patterns because they also match some non-ASCII case variants (e.g.
+# 'falſe').
+_bool_words = {'true': True, 'false': False}
+_bool_synonym_words = {'yes': True, 'on': True, 'no': False, 'off': False}
+_none_words = frozenset(('none',))
+_none_synonym_words = frozenset(('na', 'null', 'nil'))
+
+def _ascii_word(text: str) -> str | None:
+    """
+    Return the given text stripped and lowercased if it is ASCII,
+    otherwise `None`.
+    """
+    return text.strip().lower() if text.isascii() else None
+
+
+@_memoize_atom
 def is_bool(text: str) -> builtins.bool:
     """Whether the given text represents a boolean."""
-    txt = text.strip()
-    return (bool_true_pattern.fullmatch(txt) is not None
-            or bool_false_pattern.fullmatch(txt) is not None)
+    return _bool_or_none(text) is not None
+
+@_memoize_atom
+def _bool_or_none(text: str) -> builtins.bool | None:
+    word = _ascii_word(text)
+    if word is not None:
+        return _bool_words.get(word)
+    elif _bool_true_padded_pattern.fullmatch(text) is not None:
+        return True
+    elif _bool_false_padded_pattern.fullmatch(text) is not None:
+        return False
+    return None
 
 def bool(text: str, default: object=None) -> builtins.bool | object:
     """Return a boolean parsed from the given text, else `default`."""
-    txt = text.strip()
-    if bool_true_pattern.fullmatch(txt) is not None:
-        return True
-    elif bool_false_pattern.fullmatch(txt) is not None:
-        return False
-    else:
-        return default
+    value = _bool_or_none(text)
+    return value if value is not None else default
 
 def bool_err(text: str) -> tuple[builtins.bool, ParseError]:
     """
@@ -439,11 +572,9 @@ def bool_err(text: str) -> tuple[builtins.bool, ParseError]:
 
     Return a (value, error) pair per Go style.
     """
-    txt = text.strip()
-    if bool_true_pattern.fullmatch(txt) is not None:
-        return (True, None)
-    elif bool_false_pattern.fullmatch(txt) is not None:
-        return (False, None)
+    value = _bool_or_none(text)
+    if value is not None:
+        return (value, None)
     else:
         return (None, ParseError('Cannot parse a boolean from', text))
 
@@ -452,22 +583,25 @@ def is_bool_word(text: str) -> builtins.bool:
     Whether the given text is a boolean synonym word (no, yes, off,
     on).
     """
-    txt = text.strip()
-    return (bool_word_true_pattern.fullmatch(txt) is not None
-            or bool_word_false_pattern.fullmatch(txt) is not None)
+    return _bool_word_or_none(text) is not None
+
+def _bool_word_or_none(text: str) -> builtins.bool | None:
+    word = _ascii_word(text)
+    if word is not None:
+        return _bool_synonym_words.get(word)
+    elif _bool_word_true_padded_pattern.fullmatch(text) is not None:
+        return True
+    elif _bool_word_false_padded_pattern.fullmatch(text) is not None:
+        return False
+    return None
 
 def bool_word(text: str, default: object=None) -> builtins.bool | object:
     """
     Return a boolean synonym word parsed from the given text, else
     `default`.
     """
-    txt = text.strip()
-    if bool_word_true_pattern.fullmatch(txt) is not None:
-        return True
-    elif bool_word_false_pattern.fullmatch(txt) is not None:
-        return False
-    else:
-        return default
+    value = _bool_word_or_none(text)
+    return value if value is not None else default
 
 def bool_word_err(text: str) -> tuple[builtins.bool, ParseError]:
     """
@@ -475,11 +609,9 @@ def bool_word_err(text: str) -> tuple[builtins.bool, ParseError]:
 
     Return a (value, error) pair per Go style.
     """
-    txt = text.strip()
-    if bool_word_true_pattern.fullmatch(txt) is not None:
-        return (True, None)
-    elif bool_word_false_pattern.fullmatch(txt) is not None:
-        return (False, None)
+    value = _bool_word_or_none(text)
+    if value is not None:
+        return (value, None)
     else:
         return (None, ParseError(
             'Cannot parse a boolean synonym word from', text))
@@ -492,9 +624,13 @@ def bool_word_err(text: str) -> tuple[builtins.bool, ParseError]:
 # values are possible but likely very application-specific.
 
 
+@_memoize_atom
 def is_none(text: str) -> builtins.bool:
     """Whether the given text is None."""
-    return none_pattern.fullmatch(text.strip()) is not None
+    word = _ascii_word(text)
+    if word is not None:
+        return word in _none_words
+    return _none_padded_pattern.fullmatch(text) is not None
 
 def none_err(text: str) -> tuple[None, ParseError]:
     """Parse `None` from the given text or fail with an error."""
@@ -505,7 +641,10 @@ def none_err(text: str) -> tuple[None, ParseError]:
 
 def is_none_word(text: str) -> builtins.bool:
     """Whether the given text is a synonym word for None (null, nil, na)."""
-    return none_word_pattern.fullmatch(text.strip()) is not None
+    word = _ascii_word(text)
+    if word is not None:
+        return word in _none_synonym_words
+    return _none_word_padded_pattern.fullmatch(text) is not None
 
 def none_word_err(text: str) -> tuple[None, ParseError]:
     """
@@ -519,6 +658,7 @@ def none_word_err(text: str) -> tuple[None, ParseError]:
             'Cannot parse a `None` synonym word from', text))
 
 
+@_memoize_atom
 def is_empty(text: str) -> builtins.bool:
     """Whether the given text is empty or only whitespace characters."""
     return empty_pattern.fullmatch(text) is not None
@@ -534,16 +674,16 @@ def empty_err(text: str, value: object=None) -> tuple[object, ParseError]:
   ### Symbols / Names / Identifiers ###
 
 
+@_memoize_atom
 def is_name(text: str) -> builtins.bool:
     """
     Whether the given text is a name, keyword, or identifier.
     """
-    return name_pattern.fullmatch(text.strip()) is not None
+    return _name_padded_pattern.fullmatch(text) is not None
 
 def name(text: str, default: object=None) -> str | object:
     """Return a name parsed from the given text, else `default`."""
-    txt = text.strip()
-    return txt if is_name(txt) else default
+    return text.strip() if is_name(text) else default
 
 def name_err(text: str) -> tuple[str, ParseError]:
     """
@@ -551,9 +691,8 @@ def name_err(text: str) -> tuple[str, ParseError]:
 
     Return a (value, error) pair per Go style.
     """
-    txt = text.strip()
-    if is_name(txt):
-        return (txt, None)
+    if is_name(text):
+        return (text.strip(), None)
     else:
         return (None, ParseError('Cannot parse a name from', text))
 
@@ -566,12 +705,10 @@ def is_atom(text: str, allow_inf_nan: builtins.bool=True) -> builtins.bool:
     Whether the given text represents an atomic literal (int, float,
     bool, None, name).
     """
-    txt = text.strip()
-    return (is_int(txt) or
-            is_float(txt, allow_inf_nan) or
-            is_bool(txt) or
-            is_none(txt) or
-            is_name(txt))
+    # Match all the kinds of atoms in one pass rather than stripping and
+    # then calling each detector
+    return (_atom_padded_pattern if allow_inf_nan
+            else _atom_finite_padded_pattern).fullmatch(text) is not None
 
 def atom_err(
         text: str, default: object=None, allow_inf_nan: builtins.bool=True,
@@ -587,31 +724,60 @@ def atom_err(
     This recognizes and parses all the atoms that are distinguishable by
     their appearance alone.
     """
-    # Try parsing the literal in order of (assumed) frequency of types
-    txt = text.strip()
-    # Integer
-    if integer_pattern.fullmatch(txt) is not None:
+    # Reject texts that cannot start an atom
+    first_char = text[:1]
+    if first_char.isspace():
+        first_char = text.lstrip()[:1]
+    if not (first_char in _atom_first_chars or first_char.isdecimal()):
+        return (default, ParseError('Cannot parse an atom from', text))
+    # Match all the kinds of atoms in one pass.  The alternatives are in
+    # order of (assumed) frequency of types, and names must come after
+    # the other atoms whose representations are words.
+    match = (_atom_padded_pattern if allow_inf_nan
+             else _atom_finite_padded_pattern).fullmatch(text)
+    # Whitespace, strings, or non-atoms
+    if match is None:
+        return (default, ParseError('Cannot parse an atom from', text))
+    kind = match.lastgroup
+    txt = match.group(kind)
+    if kind == 'int':
         return (builtins.int(txt), None)
-    # Float
-    elif (float_pattern.fullmatch(txt) is not None or
-          (allow_inf_nan and
-           inf_nan_pattern.fullmatch(txt) is not None)):
+    elif kind == 'float' or kind == 'inf_nan':
         return (builtins.float(txt), None)
-    # Boolean
-    elif bool_true_pattern.fullmatch(txt) is not None:
+    elif kind == 'true':
         return (True, None)
-    elif bool_false_pattern.fullmatch(txt) is not None:
+    elif kind == 'false':
         return (False, None)
-    # None
-    elif none_pattern.fullmatch(txt) is not None:
+    elif kind == 'none':
         return (None, None)
-    # Name / Keyword / Identifier.  This must come after the other atoms
-    # whose representations are words.
-    elif name_pattern.fullmatch(txt) is not None:
-        return (txt, None)
-    # Whitespace, strings, or non-atoms
+    # Name / Keyword / Identifier
     else:
-        return (default, ParseError('Cannot parse an atom from', text))
+        return (txt, None)
+
+def atom_err_batch(
+        texts: Iterable[str],
+        default: object=None,
+        allow_inf_nan: builtins.bool=True,
+) -> list[tuple[object, ParseError]]:
+    """
+    Parse an atomic literal from each of the given texts as `atom_err`
+    does.  Return a list of (value, error) pairs in the same order.
+
+    This is faster than calling `atom_err` on each text when texts
+    repeat (as in the cells of a CSV column) because each distinct text
+    is only parsed once.  Each failure gets its own error.
+    """
+    parsed = {}
+    results = []
+    for text in texts:
+        result = parsed.get(text)
+        if result is None:
+            result = atom_err(text, default, allow_inf_nan)
+            parsed[text] = result
+        elif result[1] is not None:
+            result = (default, ParseError('Cannot parse an atom from', text))
+        results.append(result)
+    return results
 
 
  #### Detecting & Parsing Compound Literals ####
@@ -712,41 +878,85 @@ def datetime_err(): # TODO
     return NotImplemented
 
 
+def _timestamp_fixed_fields(text: str) -> tuple[str | None, ...] | None:
+    """
+    Split a timestamp with separated date and time fields into the
+    same fields as `timestamp_pattern` using fixed offsets.
+
+    Return `None` if the text does not have that shape so that the
+    caller can fall back to the regex.  Recognizes exactly the texts
+    that `timestamp_pattern` would match with nonempty date and time
+    separators.
+    """
+    if (len(text) < 19
+            or text[4] != text[7] or text[4].isdecimal()
+            or text[10] == '\n'
+            or text[13] != text[16] or text[13].isdecimal()):
+        return None
+    year = text[0:4]
+    month = text[5:7]
+    day = text[8:10]
+    hour = text[11:13]
+    minute = text[14:16]
+    second = text[17:19]
+    if not (year.isdecimal() and month.isdecimal() and day.isdecimal()
+            and hour.isdecimal() and minute.isdecimal()
+            and second.isdecimal()):
+        return None
+    # Optional fractional second and time zone
+    rest = text[19:]
+    tz = None
+    if (len(rest) >= 5 and rest[-5] in '+-' and rest[-4:].isdecimal()):
+        tz = rest[-5:]
+        rest = rest[:-5]
+    fractional_second = None
+    if rest:
+        if len(rest) < 2 or rest[0] not in '.,' or not rest[1:].isdecimal():
+            return None
+        fractional_second = rest[1:]
+    return (year, month, day, hour, minute, second, fractional_second, tz)
+
+# Time zones by their offset text (e.g. '-0600').  There are only a few
+# distinct offsets, so construct each one once.
+_timezones = {}
+
 def timestamp(text: str, default: object=None) -> pydt.datetime:
-    match = timestamp_pattern.fullmatch(text.strip())
-    if match is None:
-        return default
+    txt = text.strip()
+    # Try the common shape of timestamp before running the full regex
+    fields = _timestamp_fixed_fields(txt)
+    if fields is None:
+        match = timestamp_pattern.fullmatch(txt)
+        if match is None:
+            return default
+        # Get the fields in one call by number rather than building a
+        # dictionary of all the groups.  Groups 2, 5, and 7 are the
+        # separators.
+        fields = match.group(1, 3, 4, 6, 8, 9, 10, 11)
+    (year, month, day, hour, minute, second, microsecond, tz) = fields
     int = builtins.int
-    groups = match.groupdict()
     # Fix the fractional second if given
-    microsecond = groups.get('fractional_second')
     if microsecond is not None:
-        # The fractional second must be a microsecond and have at
-        # most 6 digits
-        if len(microsecond) < 6:
-            microsecond += '0' * (6 - len(microsecond))
-        elif len(microsecond) > 6:
-            microsecond = microsecond[:6]
-        # Parse as an integer
-        microsecond = int(microsecond)
-    # Construct a TZ object if needed
-    tz = groups.get('tz')
+        # The fractional second must be a microsecond and have
+        # exactly 6 digits.  Parse as an integer.
+        microsecond = int(microsecond[:6].ljust(6, '0'))
+    # Look up or construct a TZ object if needed
     if tz is not None:
-        tz_str = groups['tz']
-        delta = pydt.timedelta(
-            hours=int(tz_str[1:3]), minutes=int(tz_str[3:]))
-        if tz_str[0] == '-':
-            tz = pydt.timezone(-delta)
-        else:
-            tz = pydt.timezone(delta)
+        tz_str = tz
+        tz = _timezones.get(tz_str)
+        if tz is None:
+            minutes = int(tz_str[1:3]) * 60 + int(tz_str[3:])
+            if tz_str[0] == '-':
+                minutes = -minutes
+            tz = pydt.timezone(pydt.timedelta(minutes=minutes))
+            _timezones[tz_str] = tz
     # Parse the fields and return as a datetime
     return pydt.datetime(
-        year=int(groups['year']),
-        month=int(groups['month']),
-        day=int(groups['day']),
-        hour=int(groups['hour']),
-        minute=int(groups['minute']),
-        second=int(groups['second']),
+        year=int(year),
+        month=int(month),
+        day=int(day),
+        hour=int(hour),
+        minute=int(minute),
+        second=int(second),
         microsecond=(microsecond
                      if microsecond is not None
                      else 0),
@@ -784,22 +994,24 @@ def cli_atom_err(
     representations and whose construction is invertible.  These are
     also the relatively language-agnostic atoms.
     """
-    txt = text.strip()
-    # Integer
-    if integer_pattern.fullmatch(txt) is not None:
-        return (builtins.int(txt), None)
-    # Float
-    elif (float_pattern.fullmatch(txt) is not None or
-          (allow_inf_nan and
-           inf_nan_pattern.fullmatch(txt) is not None)):
-        return (builtins.float(txt), None)
-    # Boolean
-    elif bool_true_pattern.fullmatch(txt) is not None:
-        return (True, None)
-    elif bool_false_pattern.fullmatch(txt) is not None:
-        return (False, None)
-    else:
+    # Reject texts that cannot start a CLI atom
+    first_char = text[:1]
+    if first_char.isspace():
+        first_char = text.lstrip()[:1]
+    if not (first_char in _cli_atom_first_chars or first_char.isdecimal()):
+        return (default, ParseError('Cannot parse a CLI atom from', text))
+    # Match all the kinds of CLI atoms in one pass
+    match = (_cli_atom_padded_pattern if allow_inf_nan
+             else _cli_atom_finite_padded_pattern).fullmatch(text)
+    if match is None:
         return (default, ParseError('Cannot parse a CLI atom from', text))
+    kind = match.lastgroup
+    if kind == 'int':
+        return (builtins.int(match.group(kind)), None)
+    elif kind == 'float' or kind == 'inf_nan':
+        return (builtins.float(match.group(kind)), None)
+    else:
+        return (kind == 'true', None)
 
 
 def cli_list_err(
@@ -918,7 +1130,9 @@ def predicate(text: str, default: object=None) -> tuple[str, list] | object:
                 or args_text.isspace()):
             args = ()
         else:
-            args = naive_list_split_pattern.split(args_text.strip())
+            # Same as `naive_list_split_pattern.split(args_text.strip())`
+            # but without running a regex
+            args = [arg.strip() for arg in args_text.split(',')]
         return (name, args)
     else:
         return default
@@ -968,6 +1182,29 @@ def parse(text, detectors, constructors, default=None):
     return default, ParseError('Cannot parse', text)
 
 
+def mk_parse(
+        detectors: Iterable[Callable[[str], builtins.bool]],
+        constructors: Iterable[Callable[[str], object]],
+        default: object=None,
+) -> Callable[[str], tuple[object, ParseError]]:
+    """
+    Make a function for parsing text with the given detectors and
+    constructors.
+
+    The returned function, `parse_text(text)`, does the same as
+    `parse(text, detectors, constructors, default)`, but the detectors
+    and constructors are paired once, when the function is made, rather
+    than on every call.
+    """
+    detector_constructor_pairs = tuple(zip(detectors, constructors))
+    def parse_text(text: str) -> tuple[object, ParseError]:
+        for (detector, constructor) in detector_constructor_pairs:
+            if detector(text):
+                return constructor(text), None
+        return default, ParseError('Cannot parse', text)
+    return parse_text
+
+
 def mk_match(*matchers: Callable[[str], builtins.bool]) -> Callable[
         [str], builtins.int]:
     """
@@ -1060,7 +1297,7 @@ def mk_parse_numeric_empty_date_bool_none(
 ##### Classes & Algorithms to Help with Lexical Analysis & Parsing #####
 
 
-class TokenType(enum.Enum): # ENH convert to dynamic hierarchy of types
+class TokenType(enum.IntEnum): # ENH convert to dynamic hierarchy of types
     """Types of tokens"""
     none = 0 # None or unknown, the null type
     # Words
@@ -1103,6 +1340,9 @@ class TokenType(enum.Enum): # ENH convert to dynamic hierarchy of types
 
 class Token:
 
+    # Lexing creates many tokens, so avoid a dictionary per token
+    __slots__ = ('_type', '_position', '_length', '_line', '_column')
+
     def __init__(self, type_, position, length, line=None, column=None):
         self._type = type_
         self._position = position
@@ -1148,43 +1388,342 @@ class Token:
         return text[self.position:self.end]
 
 
+# Regex patterns that match only a literal string: characters that are
+# not special plus escaped punctuation
+_literal_regex_pattern = re.compile(r'(?:[^\\.^$*+?{}\[\]|()]|\\\W)+')
+_escape_pattern = re.compile(r'\\(.)', re.DOTALL)
+
+
+def _literal_text(regex):
+    """
+    Return the literal string matched by the given compiled regex or
+    `None` if the regex is not just a literal.
+    """
+    if (not isinstance(regex.pattern, str) or regex.flags != re.UNICODE
+            or _literal_regex_pattern.fullmatch(regex.pattern) is None):
+        return None
+    return _escape_pattern.sub(r'\1', regex.pattern)
+
+
+def _trie_pattern(trie):
+    """
+    Return a regex pattern that matches the longest string in the given
+    trie.  A trie is a dictionary mapping characters to subtries where
+    the empty string marks the end of a string.
+    """
+    alternatives = [
+        re.escape(char) + _trie_pattern(subtrie)
+        for (char, subtrie) in sorted(trie.items())
+        if char != ''
+    ]
+    if not alternatives:
+        return ''
+    elif len(alternatives) == 1 and '' not in trie:
+        return alternatives[0]
+    pattern = '(?:' + '|'.join(alternatives) + ')'
+    # Greedy optional tries the longer strings first
+    return pattern + '?' if '' in trie else pattern
+
+
+def _merge_literal_regexes(regex_token_type_pairs):
+    """
+    Merge each run of adjacent literal regexes with the same token type
+    into a single trie regex so that lexing tries one regex instead of
+    one per literal.
+
+    The lexer takes the first regex that matches, so a literal preceded
+    in its run by one of its prefixes can never match and is dropped.
+    For the rest, the first match is the longest match, which is what
+    the trie regex finds.
+    """
+    merged = []
+    run = []
+    run_type = None
+
+    def merge_run():
+        if len(run) == 1:
+            merged.append(run[0][0])
+        elif run:
+            trie = {}
+            for (_, literal) in run:
+                if any(literal.startswith(prefix) for prefix in prefixes):
+                    continue
+                prefixes.append(literal)
+                node = trie
+                for char in literal:
+                    node = node.setdefault(char, {})
+                node[''] = {}
+            merged.append((re.compile(_trie_pattern(trie)), run_type))
+        run.clear()
+        prefixes.clear()
+
+    prefixes = []
+    for (regex, token_type) in regex_token_type_pairs:
+        literal = _literal_text(regex)
+        if literal is None or (run and token_type != run_type):
+            merge_run()
+        if literal is None:
+            merged.append((regex, token_type))
+        else:
+            run.append(((regex, token_type), literal))
+            run_type = token_type
+    merge_run()
+    return tuple(merged)
+
+
+class TokenStream:
+    """
+    Sequence of tokens stored as parallel arrays of their fields rather
+    than as `Token` objects.  This takes much less memory for long
+    texts.  Indexing constructs the `Token` on demand.
+    """
+
+    __slots__ = ('_types', '_positions', '_lengths', '_lines', '_columns')
+
+    def __init__(self):
+        # Types can be any objects, so keep them in a list.  Lists of
+        # shared objects are compact enough.
+        self._types = []
+        self._positions = array.array('q')
+        self._lengths = array.array('q')
+        self._lines = array.array('q')
+        self._columns = array.array('q')
+
+    def append(self, type_, position, length, line, column):
+        self._types.append(type_)
+        self._positions.append(position)
+        self._lengths.append(length)
+        self._lines.append(line)
+        self._columns.append(column)
+
+    @property
+    def types(self):
+        return self._types
+
+    @property
+    def positions(self):
+        return self._positions
+
+    @property
+    def lengths(self):
+        return self._lengths
+
+    @property
+    def lines(self):
+        return self._lines
+
+    @property
+    def columns(self):
+        return self._columns
+
+    def __len__(self):
+        return len(self._types)
+
+    def __getitem__(self, index):
+        return Token(
+            self._types[index],
+            self._positions[index],
+            self._lengths[index],
+            self._lines[index],
+            self._columns[index],
+            )
+
+    def __iter__(self):
+        return map(Token, self._types, self._positions, self._lengths,
+                   self._lines, self._columns)
+
+
+# Regex syntax that refers to groups by number or name, which would
+# break if the regex were embedded in a combined regex
+_group_reference_pattern = re.compile(r'\\[1-9]|\(\?P=|\(\?\(')
+
+# Global inline flags (e.g. `(?i)`).  These must not be embedded in a
+# combined regex because (before Python 3.11) they would apply to the
+# whole combined regex.  Leading ones are already reflected in the
+# regex's flags and so can be stripped.
+_leading_global_flags_pattern = re.compile(r'(?:\(\?[aiLmsux]+\))+')
+_global_flags_pattern = re.compile(r'\(\?[aiLmsux]+\)')
+
+# Inline flags for the regex flags that can be scoped to a subpattern
+_scoped_flag_letters = (
+    (re.IGNORECASE, 'i'),
+    (re.MULTILINE, 'm'),
+    (re.DOTALL, 's'),
+    (re.VERBOSE, 'x'),
+    (re.ASCII, 'a'),
+)
+
+
+def _mk_scanner(regex_token_type_pairs):
+    """
+    Combine the given regexes into a single "scanner" regex that
+    alternates them in order, each in a group named by its index.
+
+    Return a pair of the scanner and a dictionary mapping group names to
+    token types, or `(None, None)` if the regexes cannot be combined
+    (e.g. they refer to their own groups, have conflicting group names,
+    or have global inline flags after the start).
+    """
+    alternatives = []
+    group_token_types = {}
+    for (idx, (regex, token_type)) in enumerate(regex_token_type_pairs):
+        pattern = regex.pattern
+        if (not isinstance(pattern, str)
+                or _group_reference_pattern.search(pattern) is not None):
+            return (None, None)
+        # Strip leading global flags and give up on any others
+        flags_match = _leading_global_flags_pattern.match(pattern)
+        if flags_match is not None:
+            pattern = pattern[flags_match.end():]
+        if _global_flags_pattern.search(pattern) is not None:
+            return (None, None)
+        # Scope the flags of the regex to its alternative.  End verbose
+        # patterns with a newline in case they end in a comment.
+        flags = ''.join(letter for (flag, letter) in _scoped_flag_letters
+                        if regex.flags & flag)
+        if flags:
+            newline = '\n' if regex.flags & re.VERBOSE else ''
+            pattern = f'(?{flags}:{pattern}{newline})'
+        group_name = f'_t{idx}'
+        alternatives.append(f'(?P<{group_name}>{pattern})')
+        group_token_types[group_name] = token_type
+    try:
+        scanner = re.compile('|'.join(alternatives))
+    except re.error:
+        return (None, None)
+    return (scanner, group_token_types)
+
+
 class Lexer:
 
     def __init__(self, regex_token_type_pairs):
-        self._regex_token_pairs = tuple(regex_token_type_pairs)
+        self._regex_token_pairs = _merge_literal_regexes(
+            regex_token_type_pairs)
+        # Try all the regexes at once with a combined regex if possible.
+        # Alternatives are tried in order, so the first regex to match
+        # still wins.
+        (self._scanner, self._group_token_types) = _mk_scanner(
+            self._regex_token_pairs)
+        # Bind the match methods once since the regexes are fixed
+        self._match_token_pairs = tuple(
+            (regex.match, token_type)
+            for (regex, token_type) in self._regex_token_pairs)
 
     @staticmethod
     def _update_line_column_numbers(text, text_idx, end_idx, line_num, col_num):
-        # Count the number of newlines in the given text slice
+        # Find the first newline, if any
         newline_match = newline_pattern.search(
             text, pos=text_idx, endpos=end_idx)
-        while newline_match is not None:
-            line_num += 1
-            col_num = 1
-            text_idx = newline_match.end()
-            newline_match = newline_pattern.search(
-                text, pos=text_idx, endpos=end_idx)
+        if newline_match is None:
+            return line_num, col_num + end_idx - text_idx
+        text_idx = newline_match.start()
+        # Handle a lone newline (such as a newline token) directly
+        if newline_match.end() == end_idx:
+            return line_num + 1, 1
+        # Count the number of newlines in the rest of the text slice
+        # with string methods rather than searching repeatedly, treating
+        # '\r\n', '\n', and '\r' each as one newline
+        n_lfs = text.count('\n', text_idx, end_idx)
+        n_crs = text.count('\r', text_idx, end_idx)
+        n_newlines = n_lfs + n_crs
+        if n_lfs != 0 and n_crs != 0:
+            n_newlines -= text.count('\r\n', text_idx, end_idx)
         # Update the column number relative to the last newline
-        col_num += end_idx - text_idx
+        last_idx = max(text.rfind('\n', text_idx, end_idx),
+                       text.rfind('\r', text_idx, end_idx))
         # Return the updated locations
-        return line_num, col_num
+        return line_num + n_newlines, end_idx - last_idx
 
     def lex(self, text):
+        return self._lex(text, Token)
+
+    def lex_stream(self, text):
+        """
+        Lex the given text into a `TokenStream` rather than generating
+        `Token` objects.
+        """
+        stream = TokenStream()
+        # Append the fields of each token to the stream instead of
+        # constructing the token
+        for _ in self._lex(text, stream.append):
+            pass
+        return stream
+
+    def _lex(self, text, mk_token):
+        if self._scanner is not None:
+            return self._lex_with_scanner(text, mk_token)
+        else:
+            return self._lex_with_each_regex(text, mk_token)
+
+    def _lex_with_scanner(self, text, mk_token):
+        # Bind attributes to locals since they are used in the inner loop
+        group_token_types = self._group_token_types
+        update_line_column_numbers = self._update_line_column_numbers
+        text_idx = 0
+        line_num = 1
+        col_num = 1
+        # The regex engine finds each next match, so any gap between
+        # matches is unmatched (unknown) text
+        for match in self._scanner.finditer(text):
+            (match_idx, end_idx) = match.span()
+            # Yield any unmatched (unknown) text
+            if match_idx > text_idx:
+                yield mk_token(
+                    TokenType.none,
+                    text_idx,
+                    match_idx - text_idx,
+                    line_num,
+                    col_num,
+                    )
+                # Update line and column numbers
+                line_num, col_num = update_line_column_numbers(
+                    text, text_idx, match_idx, line_num, col_num)
+            # Return this token.  Its type is that of the regex whose
+            # group matched.
+            yield mk_token(
+                group_token_types[match.lastgroup],
+                match_idx,
+                end_idx - match_idx,
+                line_num,
+                col_num,
+                )
+            # Update line and column numbers
+            line_num, col_num = update_line_column_numbers(
+                text, match_idx, end_idx, line_num, col_num)
+            # Update position
+            text_idx = end_idx
+        # Yield any remaining unmatched text
+        if text_idx < len(text):
+            yield mk_token(
+                TokenType.none,
+                text_idx,
+                len(text) - text_idx,
+                line_num,
+                col_num,
+                )
+
+    def _lex_with_each_regex(self, text, mk_token):
+        # Bind attributes to locals since they are used in the inner loop
+        regex_token_pairs = self._regex_token_pairs
+        match_token_pairs = self._match_token_pairs
+        update_line_column_numbers = self._update_line_column_numbers
+        text_len = len(text)
+        next_match_idxs = [-1] * len(regex_token_pairs)
         text_idx = 0
         line_num = 1
         col_num = 1
         unk_idx = None
-        while text_idx < len(text):
+        while text_idx < text_len:
             # Maintain as an indicator if anything matched
             match = None
-            for regex, token_type in self._regex_token_pairs:
-                match = regex.match(text, pos=text_idx)
+            for (regex_match, token_type) in match_token_pairs:
+                match = regex_match(text, text_idx)
                 if match is not None:
                     # Match end index
                     end_idx = match.end()
                     # Yield any unmatched (unknown) text
                     if unk_idx is not None:
-                        yield Token(
+                        yield mk_token(
                             TokenType.none,
                             unk_idx,
                             text_idx - unk_idx,
@@ -1192,14 +1731,12 @@ class Lexer:
                             col_num,
                             )
                         # Update line and column numbers
-                        line_num, col_num = (
-                            self._update_line_column_numbers(
-                                text, unk_idx, text_idx,
-                                line_num, col_num))
+                        line_num, col_num = update_line_column_numbers(
+                            text, unk_idx, text_idx, line_num, col_num)
                         # Clear unknown token
                         unk_idx = None
                     # Return this token
-                    yield Token(
+                    yield mk_token(
                         token_type,
                         text_idx,
                         end_idx - text_idx,
@@ -1207,9 +1744,8 @@ class Lexer:
                         col_num,
                         )
                     # Update line and column numbers
-                    line_num, col_num = (
-                        self._update_line_column_numbers(
-                            text, text_idx, end_idx, line_num, col_num))
+                    line_num, col_num = update_line_column_numbers(
+                        text, text_idx, end_idx, line_num, col_num)
                     # Update position
                     text_idx = end_idx
                     # Continue while loop (no loop labels, so use the
@@ -1218,13 +1754,26 @@ class Lexer:
             # Continue while loop if match
             if match is not None:
                 continue
-            # No match.  Try again starting at the next character.
+            # No match.  Skip ahead to the next position where any regex
+            # matches rather than retrying every regex at every
+            # character.  The next match start of each regex is cached
+            # because it stays valid until the text index passes it.
             if unk_idx is None:
                 unk_idx = text_idx
-            text_idx += 1
+            search_idx = text_idx + 1
+            text_idx = text_len
+            for (regex_idx, (regex, _)) in enumerate(regex_token_pairs):
+                next_idx = next_match_idxs[regex_idx]
+                if next_idx < search_idx:
+                    match = regex.search(text, search_idx)
+                    next_idx = (
+                        match.start() if match is not None else text_len)
+                    next_match_idxs[regex_idx] = next_idx
+                if next_idx < text_idx:
+                    text_idx = next_idx
         # Yield any remaining unmatched text
         if unk_idx is not None:
-            yield Token(
+            yield mk_token(
                 TokenType.none,
                 unk_idx,
                 text_idx - unk_idx,
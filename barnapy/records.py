@@ -5,12 +5,19 @@ the MIT license.  See LICENSE for details.
 """
 
 import csv
+import io
+import os
 
 from . import logging
 
 
+_read_records_logger = logging.getLogger(__name__).getChild(
+    'read_records_from_csv')
+
+
 def read_records_from_csv(
-        file, record_constructor=None, commentchar='#'):
+        file, record_constructor=None, commentchar='#',
+        buffer_size=1 << 20):
     """Generate records by reading from a CSV-formatted file.
 
     Discards comment lines (ones that start with the given comment
@@ -20,9 +27,28 @@ def read_records_from_csv(
     and assembling them into a record.  (It may throw exceptions.)  It
     essentially defines a schema on the file.  If a record constructor
     is not given, the raw CSV records (lists of strings) are returned.
+
+    The file may be a path or a file opened in text or binary mode.
+    Paths are opened (and closed when done) with a buffer of the given
+    size.  Binary files are decoded as text (with the default encoding)
+    and raw (unbuffered) binary files are read through a buffer of the
+    given size.  Text files are read as is, so for the fastest reading
+    of large files, open them with a large buffer, as in `open(path,
+    newline='', buffering=1 << 20)`, or just pass the path.
     """
-    logger = logging.getLogger(__name__).getChild(
-        'read_records_from_csv')
+    logger = _read_records_logger
+    # Open paths, and read binary files as text, buffering unbuffered
+    # ones
+    opened_file = None
+    wrappers = []
+    if isinstance(file, (str, os.PathLike)):
+        file = opened_file = open(file, newline='', buffering=buffer_size)
+    elif isinstance(file, io.RawIOBase):
+        file = io.BufferedReader(file, buffer_size=buffer_size)
+        wrappers.append(file)
+    if isinstance(file, io.BufferedIOBase):
+        file = io.TextIOWrapper(file, newline='')
+        wrappers.append(file)
     rownum = 1
     num_bad = 0
     # Wrap the following in a try/finally so that the logging is
@@ -52,6 +78,12 @@ def read_records_from_csv(
                     yield row
                     rownum += 1
     finally:
+        # Release the given file without closing it, but close the file
+        # opened here
+        for wrapper in reversed(wrappers):
+            wrapper.detach()
+        if opened_file is not None:
+            opened_file.close()
         # Log results of reading
         num_records = rownum - 1
         logger.info(
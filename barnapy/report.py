@@ -6,6 +6,25 @@
 # for details.
 
 
+import itertools as itools
+import operator
+
+
+def _mk_key_getter(indices):
+    """
+    Return a function that extracts the values at the given indices
+    from a record as a tuple.
+    """
+    # `itemgetter` returns a tuple only when given multiple indices
+    if len(indices) > 1:
+        return operator.itemgetter(*indices)
+    elif len(indices) == 1:
+        index = indices[0]
+        return lambda record: (record[index],)
+    else:
+        return lambda record: ()
+
+
 def reshape_table(
         records,
         fields=None,
@@ -60,7 +79,8 @@ def reshape_table(
         indexable collection.
     fields: Iterable<str> | Iterable<int> | N:int | None
         Names of the fields of each record as strings or integers.  If
-        N, use `range(N)`.  If `None`, use `range(len(records[0]))`.
+        N, use `range(N)`.  If `None`, use `range(N)` where N is the
+        length of the first record.
     dimension1_fields: Iterable<str> | Iterable<int> | int
         Names of the fields to include in the first dimension.  A subset
         of `fields`.
@@ -76,8 +96,15 @@ def reshape_table(
     """
     # Infer and convert all field arguments into tuples of indices /
     # names that can be interpreted as sets
+    records = iter(records)
     if fields is None:
-        fields = len(records[0]) # TODO update to work with iterable of records
+        # Infer the number of fields from the first record and then put
+        # it back so that any iterable of records can be used
+        first_record = next(records, None)
+        if first_record is None:
+            return {}, {}.keys(), {}.keys()
+        fields = len(first_record)
+        records = itools.chain((first_record,), records)
     if isinstance(fields, int):
         fields = range(fields)
     fields = tuple(fields)
@@ -100,21 +127,23 @@ def reshape_table(
     # Map fields to indices
     fld2idx = {f: i for i, f in enumerate(fields)}
     # Check for sanity among arguments
-    if not (set(d1_flds) < fld2idx.keys()):
+    d1_fld_set = frozenset(d1_flds)
+    d2_fld_set = frozenset(d2_flds)
+    if not (d1_fld_set < fld2idx.keys()):
         raise ValueError(
             'Bad dimension 1 fields: Not a proper subset of the fields '
             '{!r}: {!r}'.format(fields, d1_flds))
-    if not (set(d2_flds) < fld2idx.keys()):
+    if not (d2_fld_set < fld2idx.keys()):
         raise ValueError(
             'Bad dimension 2 fields: Not a proper subset of the fields '
             '{!r}: {!r}'.format(fields, d2_flds))
-    if len(set(d1_flds) & set(d2_flds)) > 0:
+    if not d1_fld_set.isdisjoint(d2_fld_set):
         raise ValueError(
             'Dimensions 1 and 2 have fields in common: {!r}'
-            .format(set(d1_flds) & set(d2_flds)))
+            .format(set(d1_fld_set & d2_fld_set)))
     # Infer the value field
     if value_field is None:
-        value_field = fld2idx.keys() - set(d1_flds) - set(d2_flds)
+        value_field = fld2idx.keys() - d1_fld_set - d2_fld_set
         if len(value_field) != 1:
             raise ValueError(
                 'Bad possible value fields: Does not contain a unique '
@@ -124,32 +153,48 @@ def reshape_table(
         raise ValueError(
             'Bad value field: Not among the fields {!r}: {!r}'
             .format(fields, value_field))
-    # Sets for collecting the values in each dimension
+    # Resolve the fields to indices once and make functions that
+    # extract keys from records in C rather than with generators
+    get_d1_key = _mk_key_getter([fld2idx[f] for f in d1_flds])
+    get_d2_key = _mk_key_getter([fld2idx[f] for f in d2_flds])
+    value_idx = fld2idx[value_field]
+    n_fields = len(fld2idx)
+    # Sets for collecting the values in each dimension.  These are
+    # dicts that map each key to itself so that they also intern the
+    # keys: repeated keys share one tuple object, which makes the key
+    # pairs in `values` smaller and faster to compare.
     d1_keys = {}
     d2_keys = {}
     values = {}
     # Reorganize the records by the given dimensions
     for idx, record in enumerate(records):
         # Check the record format
-        if len(record) != len(fld2idx):
+        if len(record) != n_fields:
             raise ValueError('Bad record: Record {} does not match '
                              'the fields {!r}: {!r}'
                              .format(idx, fields, record))
         # Extract the dimension values
-        d1_key = tuple(record[fld2idx[f]] for f in d1_flds)
-        d1_keys[d1_key] = None
-        d2_key = tuple(record[fld2idx[f]] for f in d2_flds)
-        d2_keys[d2_key] = None
-        val = record[fld2idx[value_field]]
+        d1_key = get_d1_key(record)
+        d1_key = d1_keys.setdefault(d1_key, d1_key)
+        d2_key = get_d2_key(record)
+        d2_key = d2_keys.setdefault(d2_key, d2_key)
+        val = record[value_idx]
         key = (d1_key, d2_key)
-        if key in values:
+        # Insert with one lookup.  Every earlier record added exactly
+        # one entry, so if this one did not, then its key is a
+        # duplicate.  (Comparing the returned value with `val` by
+        # identity would miss duplicates with equal, interned values.)
+        prev_val = values.setdefault(key, val)
+        if len(values) == idx:
             raise ValueError('Key {!r} has 2 values: {!r} {!r}'
-                             .format(key, values[key], val))
-        else:
-            values[d1_key, d2_key] = val
+                             .format(key, prev_val, val))
     return values, d1_keys.keys(), d2_keys.keys()
 
 
 def matrix_from(table, keys1, keys2, default=0):
-    return [[table.get((k1, k2), default) for k2 in keys2]
+    # Look up each row with `map` so that the key pairs are built and
+    # looked up in C rather than in a comprehension
+    get = table.get
+    return [list(map(get, zip(itools.repeat(k1), keys2),
+                     itools.repeat(default)))
             for k1 in keys1]
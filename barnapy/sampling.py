@@ -8,7 +8,23 @@
 
 
 import itertools as itools
+import math
 import random
+import sys
+
+
+_LOG_2 = math.log(2)
+
+# Sentinel for the end of an iterator
+_no_item = object()
+
+
+def _random_nonzero(prng):
+    """Return a uniform random number in (0, 1) from the given PRNG."""
+    number = prng.random()
+    while number == 0.0:
+        number = prng.random()
+    return number
 
 
 def reservoir_sample(items, sample_size, prng=random):
@@ -24,7 +40,10 @@ def reservoir_sample(items, sample_size, prng=random):
 
     * items: Iterable
     * sample_size: How many samples to return in the reservoir
-    * prng: The pseudo-random number generator to use
+    * prng: The pseudo-random number generator to use.  It must
+      provide `randrange` and should provide `random` (like
+      `random.Random`).  Without `random`, each item is sampled with a
+      call to `randrange`, which is much slower.
 
     References:
     * http://en.wikipedia.org/wiki/Reservoir_sampling
@@ -32,22 +51,44 @@ def reservoir_sample(items, sample_size, prng=random):
       http://dl.acm.org/citation.cfm?doid=3147.3165
     * Vitter, J.S.  Faster methods for random sampling.  1984.
       http://dl.acm.org/citation.cfm?doid=358105.893
+    * Li, K.-H.  Reservoir-sampling algorithms of time complexity
+      O(n(1 + log(N/n))).  1994.  https://doi.org/10.1145/198429.198435
     """
     # Fill the reservoir
     items = iter(items)
     reservoir = list(itools.islice(items, sample_size))
-    # Sample the remaining items with decreasing probability: always
-    # replace an item from the reservoir with the current item with
-    # probability `sampleSize / itemCount`.  The first item is seen
-    # right away, hence 'itemCount' starts at `sampleSize + 1`.  If the
-    # reservoir was not filled, then this loop will not execute as the
-    # items iterator will be exhausted.
-    for count, item in enumerate(items, start=(sample_size + 1)):
-        replace_idx = prng.randrange(count)
-        if replace_idx < sample_size:
-            reservoir[replace_idx] = item
+    if sample_size <= 0 or len(reservoir) < sample_size:
+        return reservoir
+    # Without uniform floats, replace an item from the reservoir with
+    # the current item with probability `sample_size / item_count`
+    if not hasattr(prng, 'random'):
+        for count, item in enumerate(items, start=(sample_size + 1)):
+            replace_idx = prng.randrange(count)
+            if replace_idx < sample_size:
+                reservoir[replace_idx] = item
+        return reservoir
+    # Sample the remaining items using Vitter's Algorithm L (Li 1994).
+    # Rather than drawing a random number for every item, draw how many
+    # items to skip before the next replacement, which follows a
+    # geometric distribution.  `W` (the largest of the `sample_size`
+    # uniform keys kept so far) is tracked by its logarithm to avoid
+    # underflow and to compute `log(1 - W)` accurately.
+    log_w = math.log(_random_nonzero(prng)) / sample_size
+    while True:
+        log_1mw = (math.log(-math.expm1(log_w)) if log_w > -_LOG_2
+                   else math.log1p(-math.exp(log_w)))
+        # `W` is so small that there will never be another replacement
+        if log_1mw == 0.0:
+            break
+        n_skip = min(math.floor(math.log(_random_nonzero(prng)) / log_1mw),
+                     sys.maxsize - 1)
+        # Skip items and take the next one, if any
+        item = next(itools.islice(items, n_skip, None), _no_item)
+        if item is _no_item:
+            break
+        reservoir[prng.randrange(sample_size)] = item
+        log_w += math.log(_random_nonzero(prng)) / sample_size
     return reservoir
-    # TODO update to version that uses fewer random numbers
 
 
 def reservoir_sample_in_order(items, sample_size, prng=random):
@@ -95,23 +136,22 @@ def rejection_sample(sample_generator, accept_sample, max_tries=None) -> (
         How many samples to generate and reject before giving up and
         returning.
     """
-    # Make an iterable of samples
+    # Make an iterable of at most `max_tries` samples
     samples = None
     if callable(sample_generator):
-        samples = iter(repeatedly_call(sample_generator, times=max_tries))
+        samples = repeatedly_call(sample_generator, times=max_tries)
     elif hasattr(sample_generator, '__iter__'):
         samples = iter(sample_generator)
+        if max_tries is not None:
+            samples = itools.islice(samples, max(max_tries, 0))
     else:
         raise ValueError('Not an iterable or callable: '
                          f'sample_generator = {sample_generator}')
-    # Loop to generate samples until one is accepted or the number of
-    # tries runs out
+    # Loop to generate samples until one is accepted or the samples run
+    # out.  Bounding the samples above leaves only the acceptance test
+    # in the loop.
     n_tries = 0
-    sentinel = object()
-    sample = next(samples, sentinel)
-    while sample is not sentinel and (max_tries is None or n_tries < max_tries):
-        n_tries += 1
+    for (n_tries, sample) in enumerate(samples, start=1):
         if accept_sample(sample):
             return (True, n_tries, sample)
-        sample = next(samples, sentinel)
     return (False, n_tries, None)
@@ -4,12 +4,19 @@
 # under the MIT license.  See LICENSE for details.
 
 
+import functools
+import os
 import os.path
 import shlex
 import shutil
 import subprocess
 import sys
 
+try:
+    import fcntl
+except ImportError: # Not on POSIX
+    fcntl = None
+
 
 class ShellError(Exception):
     pass
@@ -19,14 +26,31 @@ def resolve_path(path):
     return os.path.abspath(os.path.expanduser(path))
 
 
+@functools.lru_cache(maxsize=256)
+def _which(name, search_path):
+    # Cached because `shutil.which` stats candidates in every directory
+    # in the search path.  Keyed on the search path so that changes to
+    # `PATH` are observed.  Failures raise and so are not cached.
+    resolved = shutil.which(name, path=search_path)
+    if resolved is None:
+        raise ShellError('Executable not found: {!r}'.format(name))
+    return resolved
+
+
 def resolve_executable(path): # TODO check if path exists or not?
     if os.path.sep in path:
         return resolve_path(path)
     else:
-        resolved = shutil.which(path)
-        if resolved is None:
-            raise ShellError('Executable not found: {!r}'.format(path))
-        return resolved
+        return _which(path, os.environ.get('PATH'))
+
+
+def _check_exit_status(returncode, out=None):
+    if returncode < 0:
+        raise ShellError(
+            'Process exited with signal: {}'.format(-returncode), out)
+    elif returncode > 0:
+        raise ShellError(
+            'Process exited with error status: {}'.format(returncode), out)
 
 
 def run(executable, *args):
@@ -42,18 +66,67 @@ def run(executable, *args):
         # Capture stdout.  Stderr is inherited, not captured.
         out, err = process.communicate()
         assert err is None
-        if process.returncode == 0:
-            return out
-        elif process.returncode < 0:
-            raise ShellError(
-                'Process exited with signal: {}'
-                .format(-process.returncode),
-                out)
-        else:
-            raise ShellError(
-                'Process exited with error status: {}'
-                .format(process.returncode),
-                out)
+        _check_exit_status(process.returncode, out)
+        return out
+
+
+def run_iter(executable, *args, bufsize=1 << 16):
+    """
+    Run the given command and generate the lines of its output as they
+    are produced.
+
+    Like `run` but the output is streamed rather than collected into one
+    string, so memory use does not grow with the output and lines can
+    be processed while the program is still running.  The exit status is
+    checked after all the output has been read.
+    """
+    executable = resolve_executable(executable)
+    command = [executable]
+    command.extend(args)
+    with subprocess.Popen(
+            command,
+            bufsize=bufsize,
+            stdout=subprocess.PIPE,
+            stderr=sys.stderr,
+            universal_newlines=True) as process:
+        # Stream stdout.  Stderr is inherited, not captured.
+        yield from process.stdout
+    # Exiting the context waited for the process
+    _check_exit_status(process.returncode)
+
+
+# Characters that make `shlex.split` do more than return its input
+_shlex_special_chars = frozenset(' \t\r\n\'"\\')
+
+
+@functools.lru_cache(maxsize=1024)
+def _split_command(command):
+    # Cached because pipelines are often built in loops from the same
+    # command strings.  Tuples so that the cached values are immutable.
+    return tuple(shlex.split(command))
+
+
+# Linux only
+_F_SETPIPE_SZ = getattr(fcntl, 'F_SETPIPE_SZ', None)
+
+_pipe_size = 1 << 20
+"""
+Capacity to request for pipes between processes (where supported).
+Unprivileged processes may have pipes of up to 1 MiB by default (see
+`/proc/sys/fs/pipe-max-size`).
+"""
+
+
+def _enlarge_pipe(file):
+    """
+    Try to enlarge the capacity of the given pipe so that the processes
+    on either end block and switch less often.  Best effort.
+    """
+    if _F_SETPIPE_SZ is not None:
+        try:
+            fcntl.fcntl(file.fileno(), _F_SETPIPE_SZ, _pipe_size)
+        except OSError:
+            pass
 
 
 class Pipeline:
@@ -62,9 +135,21 @@ class Pipeline:
     output.  The processes will run in parallel with Python.
     """
 
-    def __init__(self, *args):
-        """The arguments are the same as for `pipe`."""
+    def __init__(self, *args, close_fds=True):
+        """
+        The positional arguments are the same as for `pipe`.
+
+        `close_fds`: Whether to close the inheritable file descriptors
+            of this process (other than standard IO) in the child
+            processes, as for `subprocess.Popen`.  Passing `False` lets
+            `subprocess` start the processes with `posix_spawn` rather
+            than forking, which is much faster for large parents, but
+            then the child processes inherit any file descriptors this
+            process has made inheritable.  (Those that Python opens are
+            non-inheritable, per PEP 446.)
+        """
         self._argss = []
+        self._close_fds = close_fds
         self._popens = None
         if args:
             self.pipe(*args)
@@ -93,8 +178,10 @@ class Pipeline:
         else:
             # Make sure all arguments are strings
             new_args = [str(a) for a in args]
-            # Split the first argument
-            new_args[0:1] = shlex.split(new_args[0])
+            # Split the first argument, unless it is a plain word
+            command = new_args[0]
+            if not command or not _shlex_special_chars.isdisjoint(command):
+                new_args[0:1] = _split_command(command)
             # Add this command to the pipeline
             self._argss.append(new_args)
         return self
@@ -110,11 +197,18 @@ class Pipeline:
             # Create this process, pipe its input from the previous
             # process (if any), and pipe its output to the next process.
             # Let the IO be binary except for the last process.
+            #
+            # Resolving the executable (and not closing FDs, if so
+            # requested) lets `subprocess` start the process with
+            # `posix_spawn` rather than forking.
             process = subprocess.Popen(
                 args,
+                executable=resolve_executable(os.fspath(args[0])),
                 stdin=(popens[-1].stdout if len(popens) > 0 else None),
                 stdout=subprocess.PIPE,
+                close_fds=self._close_fds,
                 universal_newlines=(idx == last_idx))
+            _enlarge_pipe(process.stdout)
             # Close the previous process's stdout so that SIGPIPE works
             # as described in
             # https://docs.python.org/3/library/subprocess.html#replacing-shell-pipeline
@@ -133,11 +227,21 @@ class Pipeline:
 
     def cleanup(self):
         """Call `wait` on each process in the pipeline to clean it up."""
-        # Exhaust remaining input
-        for line in self:
-            pass
-        # Wait on each process # TODO wait forward or backward?
-        for process in self._popens:
+        if self._popens is None:
+            self._assemble()
+        # Exhaust remaining input.  Discard it in large chunks rather
+        # than decoding and splitting it into lines.
+        stdout = self._popens[-1].stdout
+        if not stdout.closed:
+            while stdout.buffer.read(1 << 16):
+                pass
+            stdout.close()
+        # Reap the processes that have already exited and then wait on
+        # the rest.  (Every process has to be waited on, so the order
+        # does not change how long this takes.)
+        running = [process for process in self._popens
+                   if process.poll() is None]
+        for process in running:
             process.wait()
 
     # TODO Pipeline.run? (without reading output of pipeline, e.g. if output to file)
@@ -1,10 +1,18 @@
 # Statistics functions not provided in the standard library or in NumPy
 # / SciPy.
 
+import heapq
 import math
 
+
+# Select quantiles with a heap rather than by sorting when they are
+# within this fraction of either end of the data.  Beyond this, sorting
+# (which is in C) is faster.
+_heap_select_fraction = 1 / 20
+
+
 # TODO add interpolation a la numpy.percentile (lower, upper, nearest, midpoint, linear)
-# TODO update to algorithm that doesn't need to store / sort all data
+# TODO update to algorithm that doesn't need to store all data
 def quantile(data, probability, key=None):
     """Return the smallest item `x` of the data such that
     `probability <= empirical-CDF(x)`.
@@ -25,7 +33,7 @@ def quantile(data, probability, key=None):
     if not (0 <= probability <= 1):
         raise ValueError(
             'Probability not in [0,1]: {}'.format(probability))
-    data = sorted(data, key=key)
+    data = list(data)
     len_data = len(data)
     if len_data == 0:
         raise ValueError('Empty data.')
@@ -35,4 +43,17 @@ def quantile(data, probability, key=None):
     # makes quantile_idx == -1)
     if quantile_idx == -1:
         quantile_idx = 0
+    # Select extreme quantiles in O(n log k) time with a heap of the k
+    # items nearest the end.  The result is the same item that sorting
+    # would give, even among ties, because both selections are stable.
+    # (Stable descending order of the reversed data is the reverse of
+    # stable ascending order of the data.)
+    n_smallest = quantile_idx + 1
+    n_largest = len_data - quantile_idx
+    max_heap_size = len_data * _heap_select_fraction
+    if n_smallest <= n_largest and n_smallest <= max_heap_size:
+        return heapq.nsmallest(n_smallest, data, key=key)[-1]
+    elif n_largest <= max_heap_size:
+        return heapq.nlargest(n_largest, reversed(data), key=key)[-1]
+    data.sort(key=key)
     return data[quantile_idx]
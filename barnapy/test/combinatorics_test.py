@@ -56,18 +56,13 @@ class BalancedSubsetsTest_RepeatedMinScore(unittest.TestCase):
 
     @staticmethod
     def _counts_extrema(counts):
-        extrema = {}
+        # Group the counts by subset size and then take the extrema of
+        # each group with `min` and `max`
+        size2counts = {}
         for (subset, count) in counts.items():
-            subset_size = len(subset)
-            if subset_size in extrema:
-                (min_count, max_count) = extrema[subset_size]
-                if count < min_count:
-                    extrema[subset_size] = (count, max_count)
-                elif count > max_count:
-                    extrema[subset_size] = (min_count, count)
-            else:
-                extrema[subset_size] = (count, count)
-        return extrema
+            size2counts.setdefault(len(subset), []).append(count)
+        return {subset_size: (min(size_counts), max(size_counts))
+                for (subset_size, size_counts) in size2counts.items()}
 
     @staticmethod
     def _mk_size2imbalance(subset_size):
@@ -80,6 +75,9 @@ class BalancedSubsetsTest_RepeatedMinScore(unittest.TestCase):
         extrema = self._counts_extrema(counts)
         for (subset_size, (min_count, max_count)) in extrema.items():
             imbalance = size2imbalance[subset_size]
+            # Only build the (expensive) failure message on failure
+            if max_count - min_count <= imbalance:
+                continue
             # Pretty print info for evaluating the test if it fails
             srtd_counts = sorted(counts.items(), key=lambda kv: (len(kv[0]), kv[0], kv[1]))
             pprint_counts = ',\n '.join(f'{k}: {v}' for (k, v) in srtd_counts)
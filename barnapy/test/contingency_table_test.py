@@ -12,10 +12,12 @@ from .. import contingency_table as ct
 
 class TwoByTwoTableTest(unittest.TestCase):
 
-    def setUp(self):
-        self.zero = ct.TwoByTwoTable(0, 0, 0, 0)
-        self.one = ct.TwoByTwoTable(1, 1, 1, 1)
-        self.tab1 = ct.TwoByTwoTable(3, 1, 2, 4)
+    # Tables are immutable, so they can be shared by all the tests
+    @classmethod
+    def setUpClass(cls):
+        cls.zero = ct.TwoByTwoTable(0, 0, 0, 0)
+        cls.one = ct.TwoByTwoTable(1, 1, 1, 1)
+        cls.tab1 = ct.TwoByTwoTable(3, 1, 2, 4)
 
     def test_construct_no_names(self):
         expected = (
@@ -122,10 +124,11 @@ class TwoByTwoTableTest(unittest.TestCase):
 
 class TemporalTwoByTwoTableTest(TwoByTwoTableTest):
 
-    def setUp(self):
-        self.zero = ct.TemporalTwoByTwoTable(0, 0, 0, 0, 0, 0)
-        self.one = ct.TemporalTwoByTwoTable(0.7, 0.3, 1, 1, 1, 1)
-        self.tab1 = ct.TemporalTwoByTwoTable(2, 1, 3, 1, 2, 4)
+    @classmethod
+    def setUpClass(cls):
+        cls.zero = ct.TemporalTwoByTwoTable(0, 0, 0, 0, 0, 0)
+        cls.one = ct.TemporalTwoByTwoTable(0.7, 0.3, 1, 1, 1, 1)
+        cls.tab1 = ct.TemporalTwoByTwoTable(2, 1, 3, 1, 2, 4)
 
     def test_exp_bef_out(self):
         self.assertEqual(0, self.zero.exp_bef_out)
@@ -195,6 +198,29 @@ class BinaryMutualInformationTest(unittest.TestCase):
         actual = ct.binary_mutual_information(smoothed_table)
         self.assertAlmostEqual(expected, actual, places=10)
 
+    def test_nearly_independent(self):
+        # The MI is tiny, so check it to a relative tolerance.  (The
+        # expected value was computed with 60-digit decimals.)
+        table = ct.TwoByTwoTable(10**6 + 1, 10**6, 10**6, 10**6)
+        expected = 3.124996875002376e-14
+        actual = ct.binary_mutual_information(table)
+        self.assertAlmostEqual(expected, actual, delta=1e-8 * expected)
+
+    def test_tiny_cell(self):
+        # A tiny joint probability makes the ratio in the log tiny
+        table = ct.TwoByTwoTable(1e-20, 0.25, 0.25, 0.5 - 1e-20)
+        expected = 0.08494951839769874
+        actual = ct.binary_mutual_information(table)
+        self.assertAlmostEqual(expected, actual, delta=1e-12 * expected)
+
+    def test_huge_cell(self):
+        # The ratios are far from and very near 1.  (The expected value
+        # was computed with 60-digit decimals.)
+        table = ct.TwoByTwoTable(1, 0, 0, 10**17)
+        expected = 4.0143946580898777e-16
+        actual = ct.binary_mutual_information(table)
+        self.assertAlmostEqual(expected, actual, delta=1e-12 * expected)
+
     def test_positively_correlated(self):
         #   1    0
         # 1 0.95 0.03 0.98
@@ -39,3 +39,24 @@ class NumpyBitGeneratorTest(unittest.TestCase):
                 random.Random(seed)))
         actual = [new_prng.random() for _ in range(n_samples)]
         self.assertEqual(expected, actual)
+
+
+class SampleSequenceTest(unittest.TestCase):
+
+    def test_sample(self):
+        prng = numpy.random.default_rng(0)
+        for items in (list(range(100)), numpy.arange(100)):
+            with self.subTest(type(items)):
+                sample = numpy_utils.sample_sequence(items, 10, prng)
+                self.assertIsInstance(sample, type(items))
+                self.assertEqual(10, len(sample))
+                self.assertEqual(10, len(set(sample)))
+                self.assertTrue(all(0 <= item < 100 for item in sample))
+
+    def test_small_inputs(self):
+        prng = numpy.random.default_rng(0)
+        self.assertEqual([], numpy_utils.sample_sequence([], 3, prng))
+        self.assertEqual([], numpy_utils.sample_sequence([1, 2], 0, prng))
+        self.assertEqual(
+            [0, 1, 2],
+            sorted(numpy_utils.sample_sequence([0, 1, 2], 5, prng)))
@@ -317,8 +317,100 @@ class DateTimePatternsTest(unittest.TestCase):
         self.assertFalse(parse.is_timedelta(''))
 
 
+class TimestampTest(unittest.TestCase):
+
+    def test_timestamp(self):
+        dt = datetime.datetime
+        tz = datetime.timezone
+        td = datetime.timedelta
+        tests = [
+            ('2024-06-19T12:34:56', dt(2024, 6, 19, 12, 34, 56)),
+            (' 2024/06/19 12.34.56 ', dt(2024, 6, 19, 12, 34, 56)),
+            ('2024-06-19 12:34:56.5', dt(2024, 6, 19, 12, 34, 56, 500000)),
+            ('2024-06-19 12:34:56,1234567',
+             dt(2024, 6, 19, 12, 34, 56, 123456)),
+            ('2024-06-19T12:34:56+0130',
+             dt(2024, 6, 19, 12, 34, 56, tzinfo=tz(td(hours=1, minutes=30)))),
+            ('2024-06-19T12:34:56.25-0800',
+             dt(2024, 6, 19, 12, 34, 56, 250000, tzinfo=tz(td(hours=-8)))),
+            ('20240619T123456', dt(2024, 6, 19, 12, 34, 56)),
+            ('20240619 1234:56', None),
+            ('2024-06/19T12:34:56', None),
+            ('2024-06-19T12:34:56.', None),
+            ('2024-06-19T12:34:56+01', None),
+            ('2024-06-19\n12:34:56', None),
+            ('', None),
+        ]
+        for (text, exp) in tests:
+            with self.subTest(text):
+                self.assertEqual(exp, parse.timestamp(text))
+
+
+class StringPatternsTest(unittest.TestCase):
+
+    def test_escaped(self):
+        pattern = parse.string_escaped_double_quoted_pattern
+        for txt in ['""', '"a"', r'"a\"b"', r'"\\"', r'"a\\\"\\"']:
+            with self.subTest(txt):
+                self.assertIsNotNone(pattern.fullmatch(txt))
+        for txt in ['"', '"a', r'"a\"', r'"\\\"', '"a"b"']:
+            with self.subTest(txt):
+                self.assertIsNone(pattern.fullmatch(txt))
+
+    def test_doubled(self):
+        pattern = parse.string_doubled_double_quoted_pattern
+        for txt in ['""', '"a"', '"a""b"', '""""', '"a""""b"']:
+            with self.subTest(txt):
+                self.assertIsNotNone(pattern.fullmatch(txt))
+        for txt in ['"', '"a', '"a""', '"""', '"a"b"']:
+            with self.subTest(txt):
+                self.assertIsNone(pattern.fullmatch(txt))
+
+    def test_unterminated_no_backtracking(self):
+        # These would take exponential time with nested repetition
+        text = '"' + 'a' * 10000
+        for pattern in (parse.string_escaped_double_quoted_pattern,
+                        parse.string_doubled_double_quoted_pattern):
+            with self.subTest(pattern.pattern):
+                self.assertIsNone(pattern.match(text))
+
+
+class AtomTest(unittest.TestCase):
+
+    def test_atom_err_batch(self):
+        texts = [
+            '1', ' 2 ', '1', '3.5', 'nan', 'true', 'False', 'None', 'x',
+            '1', '', '"s"', 'x', '', '-inf', '"s"',
+        ]
+        for allow_inf_nan in (True, False):
+            with self.subTest(allow_inf_nan=allow_inf_nan):
+                results = parse.atom_err_batch(
+                    texts, default='d', allow_inf_nan=allow_inf_nan)
+                self.assertEqual(len(texts), len(results))
+                for (text, (val, err)) in zip(texts, results):
+                    (exp_val, exp_err) = parse.atom_err(
+                        text, 'd', allow_inf_nan)
+                    self.assertEqual(repr(exp_val), repr(val))
+                    self.assertEqual(repr(exp_err), repr(err))
+        # Each failure gets its own error
+        (_, err1), (_, err2) = parse.atom_err_batch(['', ''])
+        self.assertIsNot(err1, err2)
+
+
 class MkParseTest(unittest.TestCase):
 
+    def test_mk_parse(self):
+        detectors = [parse.is_int, parse.is_float, parse.is_bool]
+        constructors = [int, float, parse.bool]
+        parse_text = parse.mk_parse(detectors, constructors, default='d')
+        for text in ['12', ' -3.5 ', 'True', 'x', '']:
+            with self.subTest(text):
+                (exp_val, exp_err) = parse.parse(
+                    text, detectors, constructors, default='d')
+                (val, err) = parse_text(text)
+                self.assertEqual(exp_val, val)
+                self.assertEqual(repr(exp_err), repr(err))
+
     def test_mk_parse_numeric_empty_date_bool_none(self):
         texts = [
             '+123', '-31415926', '12d3',
@@ -434,3 +526,172 @@ class CliCompoundLiteralsTest(unittest.TestCase):
                 self.assertEqual(
                     exp_err.__dict__ if exp_err is not None else None,
                     act_err.__dict__ if act_err is not None else None)
+
+
+class PredicateTest(unittest.TestCase):
+
+    def test_predicate(self):
+        tests = [
+            ('p', ('p', ())),
+            (' p ( ) ', ('p', ())),
+            ('p(a)', ('p', ['a'])),
+            (' edge( a , b,c ) ', ('edge', ['a', 'b', 'c'])),
+            ('p(a,,b)', ('p', ['a', '', 'b'])),
+            ('p(f(x), y)', ('p', ['f(x)', 'y'])),
+            ('(a)', None),
+            ('', None),
+        ]
+        for (text, exp) in tests:
+            with self.subTest(text):
+                self.assertEqual(exp, parse.predicate(text))
+
+
+class LexerTest(unittest.TestCase):
+
+    def setUp(self):
+        self.lexer = parse.Lexer([
+            (re.compile(r'\d+'), parse.TokenType.integer),
+            (re.compile(r'[a-z]+'), parse.TokenType.name),
+            (re.compile(r'\s+'), parse.TokenType.space),
+        ])
+
+    def lex(self, text):
+        return [(tok.type, tok.position, tok.length, tok.line, tok.column)
+                for tok in self.lexer.lex(text)]
+
+    def test_lex(self):
+        exp = [
+            (parse.TokenType.name, 0, 3, 1, 1),
+            (parse.TokenType.space, 3, 1, 1, 4),
+            (parse.TokenType.integer, 4, 2, 1, 5),
+            (parse.TokenType.space, 6, 1, 1, 7),
+            (parse.TokenType.name, 7, 1, 2, 1),
+        ]
+        self.assertEqual(exp, self.lex('abc 12\nd'))
+
+    def test_unknown_runs(self):
+        tests = [
+            ('', []),
+            ('#', [(parse.TokenType.none, 0, 1, 1, 1)]),
+            ('#$%', [(parse.TokenType.none, 0, 3, 1, 1)]),
+            ('ab#$%12', [
+                (parse.TokenType.name, 0, 2, 1, 1),
+                (parse.TokenType.none, 2, 3, 1, 3),
+                (parse.TokenType.integer, 5, 2, 1, 6),
+            ]),
+            ('#$a%&', [
+                (parse.TokenType.none, 0, 2, 1, 1),
+                (parse.TokenType.name, 2, 1, 1, 3),
+                (parse.TokenType.none, 3, 2, 1, 4),
+            ]),
+            ('1#2#3', [
+                (parse.TokenType.integer, 0, 1, 1, 1),
+                (parse.TokenType.none, 1, 1, 1, 2),
+                (parse.TokenType.integer, 2, 1, 1, 3),
+                (parse.TokenType.none, 3, 1, 1, 4),
+                (parse.TokenType.integer, 4, 1, 1, 5),
+            ]),
+        ]
+        for (text, exp) in tests:
+            with self.subTest(text):
+                self.assertEqual(exp, self.lex(text))
+
+    def test_long_unknown_run(self):
+        text = 'a' + '#' * 100000 + '1'
+        exp = [
+            (parse.TokenType.name, 0, 1, 1, 1),
+            (parse.TokenType.none, 1, 100000, 1, 2),
+            (parse.TokenType.integer, 100001, 1, 1, 100002),
+        ]
+        self.assertEqual(exp, self.lex(text))
+
+    def test_literals(self):
+        # Adjacent literals of the same type are tried as one regex but
+        # must still behave as if tried in order
+        lexer = parse.Lexer([
+            (re.compile(r'int'), parse.TokenType.keyword),
+            (re.compile(r'in'), parse.TokenType.keyword),
+            (re.compile(r'i'), parse.TokenType.keyword),
+            (re.compile(r'if'), parse.TokenType.keyword),
+            (re.compile(r'\('), parse.TokenType.begin_group),
+            (re.compile(r'\(\('), parse.TokenType.begin_group),
+            (re.compile(r'[a-z]+'), parse.TokenType.name),
+        ])
+        text = 'intinifx((('
+        exp = [
+            (parse.TokenType.keyword, 0, 3),
+            (parse.TokenType.keyword, 3, 2),
+            (parse.TokenType.keyword, 5, 1),
+            (parse.TokenType.name, 6, 2),
+            (parse.TokenType.begin_group, 8, 1),
+            (parse.TokenType.begin_group, 9, 1),
+            (parse.TokenType.begin_group, 10, 1),
+        ]
+        self.assertEqual(exp, [(tok.type, tok.position, tok.length)
+                               for tok in lexer.lex(text)])
+
+    def test_regexes_not_combinable(self):
+        # Regexes that refer to their own groups are tried one by one
+        lexer = parse.Lexer([
+            (re.compile(r'(["\']).*?\1'), parse.TokenType.string),
+            (re.compile(r'[a-z]+', re.IGNORECASE), parse.TokenType.name),
+        ])
+        text = '"a\'b"Cd'
+        exp = [
+            (parse.TokenType.string, 0, 5),
+            (parse.TokenType.name, 5, 2),
+        ]
+        self.assertEqual(exp, [(tok.type, tok.position, tok.length)
+                               for tok in lexer.lex(text)])
+
+    def test_regex_flags(self):
+        lexer = parse.Lexer([
+            (re.compile(r'true', re.IGNORECASE), parse.TokenType.keyword),
+            (re.compile(r'[a-z]+'), parse.TokenType.name),
+            (re.compile(r'\d+ # digits', re.VERBOSE), parse.TokenType.integer),
+            (re.compile(r'/\*.*?\*/', re.DOTALL), parse.TokenType.comment),
+        ])
+        text = 'TRUEtrueX12/*\n*/'
+        exp = [
+            (parse.TokenType.keyword, 0, 4),
+            (parse.TokenType.keyword, 4, 4),
+            (parse.TokenType.none, 8, 1),
+            (parse.TokenType.integer, 9, 2),
+            (parse.TokenType.comment, 11, 5),
+        ]
+        self.assertEqual(exp, [(tok.type, tok.position, tok.length)
+                               for tok in lexer.lex(text)])
+
+    def test_inline_flags(self):
+        # Global inline flags apply only to their own regex
+        lexer = parse.Lexer([
+            (re.compile(r'(?i)if'), parse.TokenType.keyword),
+            (re.compile(r'[a-z]+'), parse.TokenType.name),
+            (re.compile(r'\s+'), parse.TokenType.space),
+        ])
+        text = 'IF ab XY'
+        exp = [
+            (parse.TokenType.keyword, 0, 2),
+            (parse.TokenType.space, 2, 1),
+            (parse.TokenType.name, 3, 2),
+            (parse.TokenType.space, 5, 1),
+            (parse.TokenType.none, 6, 2),
+        ]
+        self.assertIsNotNone(lexer._scanner)
+        self.assertEqual(exp, [(tok.type, tok.position, tok.length)
+                               for tok in lexer.lex(text)])
+
+    def test_lex_stream(self):
+        text = 'abc 12\n#$d\r\n34'
+        stream = self.lexer.lex_stream(text)
+        exp = self.lex(text)
+        self.assertEqual(len(exp), len(stream))
+        self.assertEqual(exp, [
+            (tok.type, tok.position, tok.length, tok.line, tok.column)
+            for tok in stream])
+        for (idx, exp_tok) in enumerate(exp):
+            with self.subTest(idx):
+                tok = stream[idx]
+                self.assertEqual(exp_tok, (tok.type, tok.position,
+                                           tok.length, tok.line, tok.column))
+        self.assertEqual([tok[1] for tok in exp], list(stream.positions))
@@ -5,6 +5,9 @@ the MIT license.  See LICENSE for details.
 """
 
 import io
+import os
+import pathlib
+import tempfile
 import unittest
 
 from .. import logging
@@ -56,6 +59,35 @@ class ReadRecordsFromCsvTest(unittest.TestCase):
         actual = tuple(records.read_records_from_csv(input))
         self.assertEqual(expected, actual)
 
+    def test_read_records_from_csv_binary(self):
+        for (name, input) in (
+                ('buffered', io.BytesIO(self.text.encode())),
+                ('raw', io.FileIO(self._write_temp_file(), 'rb')),
+        ):
+            with self.subTest(name):
+                expected = self.raw_records
+                actual = tuple(records.read_records_from_csv(input))
+                self.assertEqual(expected, actual)
+                # The given file is not closed
+                self.assertFalse(input.closed)
+                input.close()
+
+    def test_read_records_from_csv_path(self):
+        path = self._write_temp_file()
+        for input in (path, pathlib.Path(path)):
+            with self.subTest(type(input)):
+                expected = self.raw_records
+                actual = tuple(records.read_records_from_csv(input))
+                self.assertEqual(expected, actual)
+
+    def _write_temp_file(self):
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        path = os.path.join(tmp_dir.name, 'records.csv')
+        with open(path, 'wb') as file:
+            file.write(self.text.encode())
+        return path
+
     def test_read_records_from_csv(self):
         # Only accept records of length 3-5.  Strip fields of
         # whitespace.
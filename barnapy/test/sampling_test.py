@@ -6,11 +6,80 @@
 # `LICENSE` for details.
 
 
+import collections
+import random
 import unittest
 
 from .. import sampling
 
 
+class ReservoirSampleTest(unittest.TestCase):
+
+    def test_small_inputs(self):
+        prng = random.Random(0)
+        self.assertEqual([], sampling.reservoir_sample(range(5), 0, prng))
+        self.assertEqual([], sampling.reservoir_sample([], 3, prng))
+        self.assertEqual(
+            [0, 1], sampling.reservoir_sample(range(2), 3, prng))
+        self.assertEqual(
+            [0, 1, 2], sampling.reservoir_sample(range(3), 3, prng))
+
+    def test_sample(self):
+        prng = random.Random(0)
+        for (n_items, sample_size) in ((10, 3), (1000, 10), (100000, 5)):
+            with self.subTest(n_items=n_items, sample_size=sample_size):
+                sample = sampling.reservoir_sample(
+                    iter(range(n_items)), sample_size, prng)
+                self.assertEqual(sample_size, len(sample))
+                self.assertEqual(sample_size, len(set(sample)))
+                self.assertTrue(all(0 <= item < n_items for item in sample))
+
+    def test_uniform(self):
+        # Each item should be sampled with probability
+        # `sample_size / n_items`
+        prng = random.Random(0)
+        n_items = 20
+        sample_size = 4
+        n_trials = 20000
+        counts = collections.Counter()
+        for _ in range(n_trials):
+            counts.update(sampling.reservoir_sample(
+                range(n_items), sample_size, prng))
+        exp_count = n_trials * sample_size / n_items
+        for item in range(n_items):
+            with self.subTest(item):
+                self.assertAlmostEqual(
+                    exp_count, counts[item], delta=0.05 * exp_count)
+
+    def test_randrange_only_prng(self):
+        # A PRNG without `random` is sampled with `randrange` only
+        class RandrangePrng:
+            def __init__(self, seed):
+                self.randrange = random.Random(seed).randrange
+        prng = RandrangePrng(0)
+        n_items = 20
+        sample_size = 4
+        n_trials = 20000
+        counts = collections.Counter()
+        for _ in range(n_trials):
+            sample = sampling.reservoir_sample(
+                range(n_items), sample_size, prng)
+            self.assertEqual(sample_size, len(set(sample)))
+            counts.update(sample)
+        exp_count = n_trials * sample_size / n_items
+        for item in range(n_items):
+            with self.subTest(item):
+                self.assertAlmostEqual(
+                    exp_count, counts[item], delta=0.05 * exp_count)
+
+    def test_in_order(self):
+        prng = random.Random(0)
+        sample = sampling.reservoir_sample_in_order(
+            (str(i) for i in range(1000)), 10, prng)
+        self.assertEqual(10, len(sample))
+        self.assertEqual(sorted(sample, key=int), sample)
+
+
 class RepeatedlyCallTest(unittest.TestCase):
 
     def test_times(self):